@@ -22,7 +22,9 @@ VOLUME_SLIDER_MAX = 100
 DEFAULT_VOLUME = 70
 
 # Timer Constants
-POSITION_UPDATE_INTERVAL_MS = 100
+SEEK_DEBOUNCE_MS = 75  # Coalesce seeks while dragging the progress slider
+HISTORY_FLUSH_INTERVAL_MS = 30000  # Max delay before history is written out
+SETTINGS_SAVE_DELAY_MS = 500  # Quiet period before volume changes are saved
 
 # Video Controls Constants
 VIDEO_CONTROLS_HEIGHT = 60  # Allow flexible height
@@ -40,3 +42,9 @@ QUALITY_COMBO_WIDTH = 85  # Width for quality dropdown
 STREAM_LABEL_WIDTH = 35  # Width for stream label
 STREAM_PORT_WIDTH = 75  # Width for port input
 INPUT_HEIGHT = 36  # Standard height for inputs
+
+# Logging Constants
+FILE_LOG_BUFFER_CAPACITY = 512  # Records buffered before the log file is written
+
+# Transcript Constants
+TRANSCRIPT_CACHE_SIZE = 64  # Fetched transcripts kept in memory, by video ID
@@ -6,7 +6,8 @@ This module provides a wrapper around the python-vlc library for media playback.
 
 import os
 import sys
-from typing import Optional, Tuple, Union
+import threading
+from typing import Callable, Optional, Tuple, Union
 
 # Try to import vlc library
 try:
@@ -35,13 +36,48 @@ class VLCPlayer:
     for video playback and streaming functionality.
     """
 
-    def __init__(self):
-        """Initialize VLC player instance and related resources."""
+    def __init__(self, defer_init: bool = False):
+        """
+        Initialize VLC player instance and related resources.
+
+        Args:
+            defer_init: If True, skip creating the VLC instance until
+                initialize() is called, e.g. from a background thread
+        """
         self._instance = None
         self._media_player = None
         self._media = None
         self._embed_handle = None
         self._streaming_disabled = False
+        self._streaming_disabled_on_init = False
+        self._time_changed_callback: Optional[Callable[[int], None]] = None
+        # initialize() may run on a worker thread; the lock guards the
+        # handoff of the finished instance and any pending callback
+        self._init_lock = threading.Lock()
+        self._init_started = False
+        self._initialized = False
+
+        if not defer_init:
+            self.initialize()
+
+    def initialize(self) -> bool:
+        """
+        Create the VLC instance and media player.
+
+        VLC initialization enumerates audio/video output modules, which can
+        take a noticeable amount of time; this may be called from a worker
+        thread. Calling it again after a successful run is a no-op.
+
+        Returns:
+            True if a media player is available, False otherwise
+        """
+        with self._init_lock:
+            if self._init_started:
+                return self._media_player is not None
+            self._init_started = True
+
+        instance = None
+        media_player = None
 
         # Initialize VLC if available
         if VLC_AVAILABLE:
@@ -54,11 +90,13 @@ class VLCPlayer:
                     args.extend(["--quiet", "--no-interact"])
 
                 # Initialize VLC instance
-                self._instance = vlc.Instance(args)
-                self._media_player = self._instance.media_player_new()
+                instance = vlc.Instance(args)
+                media_player = instance.media_player_new()
 
             except Exception as e:
                 print(f"Error initializing VLC: {e}")
+                instance = None
+                media_player = None
                 self._streaming_disabled_on_init = True
                 self._streaming_disabled = True
         else:
@@ -66,6 +104,38 @@ class VLCPlayer:
             self._streaming_disabled_on_init = True
             self._streaming_disabled = True
 
+        # Publish only once the media player exists, so is_initialized()
+        # never reports True for a half-built player
+        with self._init_lock:
+            self._instance = instance
+            self._media_player = media_player
+            self._initialized = True
+            callback, self._time_changed_callback = self._time_changed_callback, None
+
+        # Attach a callback registered before initialization
+        if callback is not None:
+            self.set_time_changed_callback(callback)
+
+        return media_player is not None
+
+    def is_initialized(self) -> bool:
+        """
+        Check if initialize() has run.
+
+        Returns:
+            True if VLC initialization has been attempted, False otherwise
+        """
+        return self._initialized
+
+    def streaming_disabled_on_init(self) -> bool:
+        """
+        Check if streaming was disabled because VLC failed to initialize.
+
+        Returns:
+            True if streaming was disabled during initialization
+        """
+        return self._streaming_disabled_on_init
+
     def setup_embedding(self, widget: Union["QWidget", int]) -> bool:
         """
         Set up video embedding in a Qt widget or window handle.
@@ -305,6 +375,52 @@ class VLCPlayer:
         except Exception:
             return False
 
+    def set_time_changed_callback(
+        self, callback: Optional[Callable[[int], None]]
+    ) -> bool:
+        """
+        Register a callback for VLC time-changed events.
+
+        The callback is invoked from VLC's event thread with the current
+        playback time in milliseconds. Passing None detaches the callback.
+        A callback registered before initialize() is attached once the
+        media player exists.
+
+        Args:
+            callback: Function taking the playback time in milliseconds
+
+        Returns:
+            True if operation was successful, False otherwise
+        """
+        with self._init_lock:
+            if not self._initialized:
+                self._time_changed_callback = callback
+                return True
+
+        if not VLC_AVAILABLE or not self._media_player:
+            return False
+
+        try:
+            event_manager = self._media_player.event_manager()
+            if self._time_changed_callback is not None:
+                event_manager.event_detach(vlc.EventType.MediaPlayerTimeChanged)
+            self._time_changed_callback = callback
+            if callback is not None:
+                event_manager.event_attach(
+                    vlc.EventType.MediaPlayerTimeChanged, self._on_time_changed_event
+                )
+            return True
+        except Exception as e:
+            print(f"Error attaching VLC time event: {e}")
+
+        return False
+
+    def _on_time_changed_event(self, event) -> None:
+        """Forward a VLC time-changed event to the registered callback."""
+        callback = self._time_changed_callback
+        if callback is not None:
+            callback(max(0, event.u.new_time))
+
     def setup_streaming(self, port: int = 8080) -> Tuple[bool, str]:
         """
         Set up HTTP streaming on the specified port.
@@ -360,6 +476,7 @@ class VLCPlayer:
         if VLC_AVAILABLE:
             try:
                 if self._media_player:
+                    self.set_time_changed_callback(None)
                     self._media_player.stop()
                 self._media = None
                 self._media_player = None
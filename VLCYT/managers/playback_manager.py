@@ -45,6 +45,7 @@ class PlaybackManager(QObject):
     playback_stopped = Signal()
     playback_paused = Signal(bool)  # is_paused
     position_changed = Signal(float)  # position (0.0 to 1.0)
+    time_changed = Signal(int)  # playback time in milliseconds
     volume_changed = Signal(int)  # volume (0 to 100)
     playback_error = Signal(str)  # error message
 
@@ -63,6 +64,22 @@ class PlaybackManager(QObject):
         self._is_playing = False
         self._is_paused = False
 
+        # Push-based position updates from VLC's event thread
+        self._vlc_player.set_time_changed_callback(self._on_vlc_time_changed)
+
+    def _on_vlc_time_changed(self, time_ms: int) -> None:
+        """
+        Relay a VLC time-changed event as a Qt signal.
+
+        Called from VLC's event thread; receivers living in the GUI thread
+        get the signal through a queued connection.
+
+        Args:
+            time_ms: Current playback time in milliseconds
+        """
+        if self._is_playing and not self._is_paused:
+            self.time_changed.emit(time_ms)
+
     def play_url(self, url: str, start_time: Optional[int] = None) -> None:
         """
         Play video from URL.
@@ -143,6 +160,16 @@ class PlaybackManager(QObject):
             position = time_seconds * 1000 / self._vlc_player.get_length()
             self.seek(position)
 
+    def set_time(self, time_ms: int) -> None:
+        """
+        Seek to a specific time in milliseconds.
+
+        Args:
+            time_ms: Time position in milliseconds
+        """
+        if self._is_playing:
+            self._vlc_player.set_time(max(0, time_ms))
+
     def seek_relative(self, seconds_delta: int) -> None:
         """
         Seek relative to current position.
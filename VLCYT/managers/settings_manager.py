@@ -289,6 +289,8 @@ class SettingsManager:
             self.qsettings.setArrayIndex(i)
             self.qsettings.setValue("title", item.get("title", ""))
             self.qsettings.setValue("url", item.get("url", ""))
+            self.qsettings.setValue("duration", item.get("duration", 0))
+            self.qsettings.setValue("last_played", item.get("last_played", ""))
 
         self.qsettings.endArray()
         self.qsettings.sync()
@@ -309,7 +311,14 @@ class SettingsManager:
             url = self.qsettings.value("url", "")
 
             if url:  # Only add items with a valid URL
-                history_items.append({"title": title, "url": url})
+                history_items.append(
+                    {
+                        "title": title,
+                        "url": url,
+                        "duration": int(self.qsettings.value("duration", 0) or 0),
+                        "last_played": self.qsettings.value("last_played", ""),
+                    }
+                )
 
         self.qsettings.endArray()
         return history_items
@@ -564,3 +573,7 @@ class SettingsManager:
             value: Value to set
         """
         self.qsettings.setValue(key, value)
+
+    def sync(self) -> None:
+        """Write pending changes to permanent storage."""
+        self.qsettings.sync()
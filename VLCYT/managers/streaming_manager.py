@@ -207,17 +207,20 @@ class StreamingManager(QObject):
             )
             return False, f"Streaming port {self.stream_port} is not available"
 
-    def scan_for_available_ports(self) -> List[int]:
+    def scan_for_available_ports(self, start: int = 8080, end: int = 8100) -> List[int]:
         """
         Scan for available ports for streaming.
 
+        Args:
+            start: First port to try
+            end: Port to stop before; the range is kept small for performance
+
         Returns:
             List of available ports
         """
         available_ports = []
-        port_range = range(8080, 8100)  # Check a limited range for performance
 
-        for port in port_range:
+        for port in range(start, end):
             try:
                 test_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
                 test_socket.settimeout(0.1)
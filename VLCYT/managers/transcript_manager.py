@@ -44,6 +44,8 @@ class TranscriptEntry:
     Each entry has a start time, end time, and text content.
     """
 
+    __slots__ = ("start_time", "end_time", "text")
+
     def __init__(self, start_time: float, end_time: float, text: str):
         """
         Initialize transcript entry.
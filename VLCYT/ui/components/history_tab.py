@@ -152,6 +152,7 @@ class HistoryTab(BaseTab):
     # Signals
     play_from_history_requested = Signal(dict)  # Video info dictionary
     clear_history_requested = Signal()
+    history_changed = Signal()  # History needs to be persisted
 
     def __init__(self, parent=None):
         """
@@ -326,12 +327,14 @@ class HistoryTab(BaseTab):
 
         # Update display
         self.update_history(self.recently_played)
+        self.history_changed.emit()
 
     def clear_history(self):
         """Clear all history items."""
         self.recently_played.clear()
         self.history_list.clear()
         self.play_selected_button.setEnabled(False)
+        self.history_changed.emit()
 
     def get_history_data(self) -> List[Dict[str, Any]]:
         """
@@ -399,3 +402,4 @@ class HistoryTab(BaseTab):
         if 0 <= index < len(self.recently_played):
             self.recently_played.pop(index)
             self.update_history(self.recently_played)
+            self.history_changed.emit()
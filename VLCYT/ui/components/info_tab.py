@@ -4,6 +4,7 @@ Video information tab component for VLCYT.
 This module contains the InfoTab class that displays video metadata.
 """
 
+import re
 from typing import Any, Dict, Optional
 
 # Try to import Qt for UI
@@ -98,6 +99,10 @@ except ImportError:
         TextBrowserInteraction = 0
 
 
+# Simple URL pattern for links in video descriptions
+_DESCRIPTION_URL_RE = re.compile(r"(https?://[^\s]+)")
+
+
 class InfoTab(QWidget):
     """
     Tab for displaying video information and metadata.
@@ -291,13 +296,8 @@ class InfoTab(QWidget):
         Returns:
             Processed description text with clickable links
         """
-        import re
-
-        # Simple URL pattern
-        url_pattern = r"(https?://[^\s]+)"
-
         # Replace URLs with HTML links
-        processed = re.sub(url_pattern, r'<a href="\1">\1</a>', description)
+        processed = _DESCRIPTION_URL_RE.sub(r'<a href="\1">\1</a>', description)
 
         # Convert newlines to HTML breaks
         processed = processed.replace("\n", "<br/>")
@@ -69,6 +69,9 @@ except ImportError:
         def setObjectName(self, name):
             pass
 
+        def setProperty(self, name, value):
+            pass
+
         def setPlaceholderText(self, text):
             pass
 
@@ -182,6 +185,7 @@ class Toolbar(QWidget):
         # URL input field
         self.url_entry = QLineEdit()
         self.url_entry.setObjectName("urlEntry")
+        self.url_entry.setProperty("urlStyle", True)
         self.url_entry.setPlaceholderText(
             "⌁ Paste YouTube URL and press Enter to play..."
         )
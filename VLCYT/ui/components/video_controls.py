@@ -65,7 +65,7 @@ except ImportError:
 
     class QPushButton:
         def __init__(self, text="", parent=None):
-            pass
+            self._text = text
 
         def clicked(self):
             return DummySignal()
@@ -85,9 +85,15 @@ except ImportError:
         def setFixedHeight(self, height):
             pass
 
-        def setText(self, text):
+        def setFixedSize(self, width, height):
             pass
 
+        def setText(self, text):
+            self._text = text
+
+        def text(self):
+            return self._text
+
     class QSlider:
         def __init__(self, orientation, parent=None):
             pass
@@ -295,8 +301,7 @@ class VideoControls(QWidget):
         ]
 
         for button in control_buttons:
-            button.setFixedWidth(CONTROL_BUTTON_SIZE)
-            button.setFixedHeight(CONTROL_BUTTON_SIZE)
+            button.setFixedSize(CONTROL_BUTTON_SIZE, CONTROL_BUTTON_SIZE)
             button.setObjectName("controlButton")
 
         # Add buttons to playback group
@@ -354,8 +359,7 @@ class VideoControls(QWidget):
         # Mute button (placed before slider)
         self.mute_button = QPushButton("🔊")
         self.mute_button.setObjectName("muteButton")
-        self.mute_button.setFixedWidth(CONTROL_BUTTON_SIZE)
-        self.mute_button.setFixedHeight(CONTROL_BUTTON_SIZE)
+        self.mute_button.setFixedSize(CONTROL_BUTTON_SIZE, CONTROL_BUTTON_SIZE)
         volume_layout.addWidget(self.mute_button)
 
         # Volume slider
@@ -430,8 +434,7 @@ class VideoControls(QWidget):
         self.stream_button = QPushButton("📡")
         self.stream_button.setObjectName("streamButton")
         self.stream_button.setCheckable(True)
-        self.stream_button.setFixedWidth(CONTROL_BUTTON_SIZE)
-        self.stream_button.setFixedHeight(CONTROL_BUTTON_SIZE)
+        self.stream_button.setFixedSize(CONTROL_BUTTON_SIZE, CONTROL_BUTTON_SIZE)
         self.stream_button.setToolTip("Toggle audio streaming")
         stream_layout.addWidget(self.stream_button)
 
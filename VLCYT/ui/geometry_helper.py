@@ -0,0 +1,135 @@
+"""
+Window geometry persistence for VLCYT.
+
+This module contains the GeometryHelper class that saves and restores the
+geometry of top-level windows through a single shared QSettings handle.
+"""
+
+from typing import Dict, Tuple
+
+try:
+    from PySide6.QtCore import QEvent, QObject, QSettings, Qt
+
+    PYSIDE6_AVAILABLE = True
+except ImportError:
+    PYSIDE6_AVAILABLE = False
+
+    # Mock QObject for testing mode
+    class QObject:
+        """Mock QObject for testing"""
+
+        def __init__(self, parent=None):
+            pass
+
+
+class GeometryHelper(QObject):
+    """
+    Saves and restores window geometry for any number of windows.
+
+    A window registered with enable() has its geometry restored when it is
+    first shown and saved when it is closed, so individual windows and
+    dialogs need no load/save code of their own.
+
+    Maximized and fullscreen state are stored next to the geometry and
+    applied explicitly, since restoreGeometry() does not bring them back
+    reliably on every platform.
+    """
+
+    _instance = None
+
+    @classmethod
+    def instance(cls) -> "GeometryHelper":
+        """
+        Get the shared helper, creating it on first use.
+
+        Returns:
+            The GeometryHelper singleton
+        """
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        """Initialize the helper with no registered windows."""
+        super().__init__()
+        self._settings = None
+        self._keys: Dict[int, str] = {}
+        # (geometry, maximized, fullscreen) as last read or written, per
+        # window; a window is in here once it has been restored
+        self._stored: Dict[int, Tuple[bytes, bool, bool]] = {}
+
+    def _get_settings(self) -> "QSettings":
+        """
+        Lazily create the shared settings handle.
+
+        Returns:
+            QSettings instance used for every registered window
+        """
+        if self._settings is None:
+            self._settings = QSettings("ModernYouTubePlayer", "Settings")
+        return self._settings
+
+    def enable(self, widget, key: str) -> None:
+        """
+        Persist a window's geometry under a settings key.
+
+        Args:
+            widget: Top-level widget whose geometry should be kept
+            key: Settings key the geometry is stored under
+        """
+        if not PYSIDE6_AVAILABLE:
+            return
+
+        self._keys[id(widget)] = key
+        widget.installEventFilter(self)
+        widget.destroyed.connect(lambda _=None, wid=id(widget): self._forget(wid))
+
+    def _forget(self, widget_id: int) -> None:
+        """Drop bookkeeping for a destroyed window."""
+        self._keys.pop(widget_id, None)
+        self._stored.pop(widget_id, None)
+
+    def eventFilter(self, watched, event) -> bool:
+        """Restore geometry on first show and save it on close."""
+        key = self._keys.get(id(watched))
+        if key is not None:
+            if event.type() == QEvent.Type.Show:
+                if id(watched) not in self._stored:
+                    self._restore(watched, key)
+            elif event.type() == QEvent.Type.Close:
+                self._save(watched, key)
+        return False
+
+    def _restore(self, widget, key: str) -> None:
+        """Apply the stored geometry and window state, if any, to a window."""
+        settings = self._get_settings()
+        geometry = settings.value(key)
+        maximized = settings.value(f"{key}_maximized", False, type=bool)
+        fullscreen = settings.value(f"{key}_fullscreen", False, type=bool)
+        self._stored[id(widget)] = (bytes(geometry or b""), maximized, fullscreen)
+
+        if geometry:
+            widget.restoreGeometry(geometry)
+
+        # Set before the window is mapped so it is laid out only once
+        state = widget.windowState()
+        if fullscreen:
+            widget.setWindowState(state | Qt.WindowState.WindowFullScreen)
+        elif maximized:
+            widget.setWindowState(state | Qt.WindowState.WindowMaximized)
+
+    def _save(self, widget, key: str) -> None:
+        """Store a window's current geometry if it changed since restore."""
+        geometry = widget.saveGeometry()
+        current = (bytes(geometry), widget.isMaximized(), widget.isFullScreen())
+        if self._stored.get(id(widget)) == current:
+            return
+        self._stored[id(widget)] = current
+
+        settings = self._get_settings()
+        settings.setValue(key, geometry)
+        settings.setValue(f"{key}_maximized", current[1])
+        settings.setValue(f"{key}_fullscreen", current[2])
+        # Closing the last window may end the event loop before the
+        # settings' deferred write runs
+        settings.sync()
@@ -5,13 +5,21 @@ This module contains the ModernYouTubePlayer class which is the main window
 of the application.
 """
 
+import time
+from contextlib import contextmanager
+
 # Try to import Qt for UI
 try:
-    from PySide6.QtCore import QSettings, Qt, QTimer
+    from PySide6.QtCore import QElapsedTimer, QSettings, Qt, QTimer, Signal
     from PySide6.QtGui import QKeySequence, QShortcut
     from PySide6.QtWidgets import (
+        QApplication,
+        QFrame,
+        QHBoxLayout,
+        QLabel,
         QMainWindow,
         QMessageBox,
+        QPushButton,
         QVBoxLayout,
         QWidget,
     )
@@ -50,6 +58,11 @@ except ImportError:
         def setStyleSheet(self, style):
             pass
 
+    class QApplication:
+        @staticmethod
+        def instance():
+            return None
+
     class QSettings:
         def __init__(self, *args):
             self._data = {}
@@ -64,20 +77,41 @@ except ImportError:
             return self._data.get(key, default)
 
     class QTimer:
-        def __init__(self):
+        def __init__(self, parent=None):
             self.timeout = DummySignal()
 
-        def start(self, ms):
+        def setSingleShot(self, single_shot):
+            pass
+
+        def setInterval(self, ms):
+            pass
+
+        def start(self, ms=None):
             pass
 
         def stop(self):
             pass
 
+        def isActive(self):
+            return False
+
         @staticmethod
         def singleShot(ms, func):
             pass
 
+    class QElapsedTimer:
+        def __init__(self):
+            self._start = 0.0
+
+        def start(self):
+            self._start = time.monotonic()
+
+        def elapsed(self):
+            return int((time.monotonic() - self._start) * 1000)
+
     class DummyStatusBar:
+        __slots__ = ()
+
         def addWidget(self, widget):
             pass
 
@@ -85,6 +119,8 @@ except ImportError:
             pass
 
     class DummySignal:
+        __slots__ = ()
+
         def connect(self, func):
             pass
 
@@ -138,6 +174,9 @@ except ImportError:
         def setSizePolicy(self, horizontal, vertical):
             pass
 
+    class QFrame(QWidget):
+        pass
+
     class QVBoxLayout:
         def __init__(self, parent=None):
             pass
@@ -267,13 +306,28 @@ from ..constants import (
     DEFAULT_VOLUME,
     DEFAULT_WINDOW_HEIGHT,
     DEFAULT_WINDOW_WIDTH,
-    POSITION_UPDATE_INTERVAL_MS,
+    HISTORY_FLUSH_INTERVAL_MS,
+    SEEK_DEBOUNCE_MS,
+    SETTINGS_SAVE_DELAY_MS,
     STANDARD_SPACING,
 )
 from ..core.vlc_player import VLCPlayer
+from ..exceptions import SecurityError, ValidationError
 from ..managers.playback_manager import PlaybackManager
+from ..managers.settings_manager import SettingsManager
+from ..managers.streaming_manager import StreamingManager
 from ..managers.thread_manager import ThreadManager
+from ..managers.transcript_manager import TranscriptManager
+from ..models import PlaylistItem
 from ..utils.format_utils import format_time
+from ..utils.logging_config import get_logger, initialize_logging
+from ..validators import URLValidator
+from .components.player_widget import PlayerWidget
+from .components.status_bar_widget import StatusBarWidget
+from .components.tab_container import TabContainer
+from .components.toolbar import Toolbar
+from .geometry_helper import GeometryHelper
+from .theme import ThemeManager
 
 
 class ModernYouTubePlayer(QMainWindow):
@@ -288,81 +342,281 @@ class ModernYouTubePlayer(QMainWindow):
     - History tracking
     """
 
+    # Default keyboard shortcuts as (key sequence, handler method name)
+    _SHORTCUTS = (
+        # Playback shortcuts
+        ("Space", "toggle_play_pause"),
+        ("Escape", "exit_fullscreen"),
+        ("F", "toggle_video_fullscreen"),
+        ("M", "toggle_mute"),
+        # Seek shortcuts
+        ("Left", "_seek_backward"),
+        ("Right", "_seek_forward"),
+        ("Shift+Left", "_seek_backward_long"),
+        ("Shift+Right", "_seek_forward_long"),
+        # Volume shortcuts
+        ("Up", "_volume_up"),
+        ("Down", "_volume_down"),
+    )
+
+    # Emitted from the worker thread once VLC has been initialized
+    if PYSIDE6_AVAILABLE:
+        backend_ready = Signal()
+        # Emitted from a worker thread with settings read at startup
+        startup_data_ready = Signal(object)
+
     def __init__(self):
         """Initialize the main application window."""
         super().__init__()
 
-        # Initialize logging system first
-        from ..utils.logging_config import get_logger, initialize_logging
-
-        self.log_manager = initialize_logging("VLCYT")
+        # Per-phase startup timings as (phase name, milliseconds)
         self.logger = get_logger("vlcyt.main")
+        self._startup_timings = []
+        startup_timer = QElapsedTimer()
+        startup_timer.start()
+
+        # Initialize logging system first
+        with self._profile("initialize_logging"):
+            self.log_manager = initialize_logging("VLCYT")
         self.logger.info("Starting Modern YouTube Player application")
 
         # Core components initialization
         self.qsettings = QSettings("ModernYouTubePlayer", "Settings")
-        self.vlc_player = VLCPlayer()
-        self.thread_manager = ThreadManager(max_threads=8)
+        # VLC is initialized off the UI thread, see _start_backend_init()
+        with self._profile("VLCPlayer init"):
+            self.vlc_player = VLCPlayer(defer_init=True)
+        with self._profile("ThreadManager init"):
+            self.thread_manager = ThreadManager(max_threads=8)
 
         # Initialize managers
-        from ..managers.settings_manager import SettingsManager
-        from ..managers.transcript_manager import TranscriptManager
-        from ..managers.streaming_manager import StreamingManager
-
-        self.settings_manager = SettingsManager(self.qsettings)
-        self.playback_manager = PlaybackManager(self.vlc_player, self.thread_manager)
-        self.transcript_manager = TranscriptManager(self.thread_manager)
-        self.streaming_manager = StreamingManager(self.vlc_player)
-
-        # Initialize position timer for progress bar updates
-        self.position_timer = QTimer()
-        self.position_timer.timeout.connect(self.update_position)
+        with self._profile("managers init"):
+            self.settings_manager = SettingsManager(self.qsettings)
+            self.playback_manager = PlaybackManager(
+                self.vlc_player, self.thread_manager
+            )
+            self.transcript_manager = TranscriptManager(self.thread_manager)
+            self.streaming_manager = StreamingManager(self.vlc_player)
+
+        # Coalesce seeks while the progress slider is being dragged
+        self._seek_debounce = QTimer(self)
+        self._seek_debounce.setSingleShot(True)
+        self._seek_debounce.setInterval(SEEK_DEBOUNCE_MS)
+        self._seek_debounce.timeout.connect(self._apply_pending_seek)
+
+        # Batch history writes instead of saving on every playback start
+        self._history_dirty = False
+        self._history_loaded = False
+        self._history_flush_timer = QTimer(self)
+        self._history_flush_timer.setSingleShot(True)
+        self._history_flush_timer.setInterval(HISTORY_FLUSH_INTERVAL_MS)
+        self._history_flush_timer.timeout.connect(self.flush_history)
+
+        # Save settings once a burst of volume changes has settled
+        self._settings_save_timer = QTimer(self)
+        self._settings_save_timer.setSingleShot(True)
+        self._settings_save_timer.setInterval(SETTINGS_SAVE_DELAY_MS)
+        self._settings_save_timer.timeout.connect(self.save_settings)
+        # Volume last read from or written to settings; restoring it is no change
+        self._saved_volume = None
+
+        # Owned by the window, so a pending auto-play dies with it
+        self._autoplay_timer = QTimer(self)
+        self._autoplay_timer.setSingleShot(True)
+        self._autoplay_timer.setInterval(0)
+        self._autoplay_timer.timeout.connect(self.play_video_thread)
+
+        # Keyboard shortcuts by handler method name, see setup_shortcuts()
+        self._shortcuts = {}
 
         # UI state
         self.is_muted = False
+        self._slider_pressed = False
+        self._pending_seek = None
+        self._progress_length = 0  # Progress slider range in milliseconds
         self.volume_before_mute = DEFAULT_VOLUME
         self.current_playlist_index = -1
 
+        # Transcript auto-scroll gating, kept current by signals
+        self._auto_scroll_enabled = True
+        self._has_transcript = False
+        self._transcript_tab_visible = False
+
         # Current video info and state
         self.current_video_info = None
         self.current_url = None
+        # URL passed to load_url() before the VLC backend was ready
+        self._pending_url = None
+        # Set on the main thread by _on_backend_ready(), once embedding is done
+        self._backend_ready = False
 
         # UI components (will be initialized in setup_ui)
         self.toolbar = None
         self.player_widget = None
+        self.video_frame = None
+        self.video_controls = None
+        self._volume_slider = None
         self.tab_container = None
+        self.playlist_tab = None
+        self.transcript_tab = None
+        self.history_tab = None
         self.status_bar_widget = None
+        self._main_layout = None
+        self._banner = None
+
+        # Setup UI and connections
+        with self._profile("setup_ui"):
+            self.setup_ui()
+        with self._profile("apply_theme"):
+            self.apply_theme()
+        with self._profile("setup_shortcuts"):
+            self.setup_shortcuts()
+        with self._profile("setup_manager_connections"):
+            self.setup_manager_connections()  # After UI components are created
+
+        # Load settings; volume and history are read in the background
+        with self._profile("load_settings"):
+            self.load_settings()
+        with self._profile("load_playlists"):
+            self.load_playlists()
+        with self._profile("start_startup_data_load"):
+            self._start_startup_data_load()
+
+        # Bring up VLC last so the window can be shown right away
+        self._start_backend_init()
+
+        self._log_startup_report(startup_timer.elapsed())
+
+    @contextmanager
+    def _profile(self, name):
+        """
+        Time a startup phase and record it in the startup report.
+
+        Args:
+            name: Phase name used in the log output
+        """
+        timer = QElapsedTimer()
+        timer.start()
+        try:
+            yield
+        finally:
+            elapsed = timer.elapsed()
+            self._startup_timings.append((name, elapsed))
+            self.logger.info(f"{name}: {elapsed} ms")
+
+    def _log_startup_report(self, total_ms):
+        """
+        Log the aggregated startup timings, slowest phase first.
+
+        Args:
+            total_ms: Total time spent in __init__ in milliseconds
+        """
+        phases = sorted(self._startup_timings, key=lambda item: item[1], reverse=True)
+        report = ", ".join(f"{name} {elapsed} ms" for name, elapsed in phases)
+        self.logger.info(f"Startup finished in {total_ms} ms ({report})")
+
+    def _start_backend_init(self):
+        """Initialize the VLC backend in a worker thread."""
+        if not PYSIDE6_AVAILABLE:
+            self.vlc_player.initialize()
+            self._on_backend_ready()
+            return
+
+        self.toolbar.set_play_button_enabled(False)
+        self.status_bar_widget.update_status("Initializing backend...")
+        self.backend_ready.connect(self._on_backend_ready)
+        self.thread_manager.submit_task(self._initialize_backend)
+
+    def _initialize_backend(self):
+        """Worker thread entry point for VLC initialization."""
+        timer = QElapsedTimer()
+        timer.start()
+        try:
+            self.vlc_player.initialize()
+            self.logger.info(f"VLC backend init: {timer.elapsed()} ms")
+        finally:
+            # Delivered to the UI thread through a queued connection
+            self.backend_ready.emit()
+
+    def _on_backend_ready(self):
+        """Finish wiring the VLC backend once it is initialized."""
+        self.setup_vlc_embedding()
+        self._backend_ready = True
+
+        # Startup data may have restored the volume before a media player
+        # existed to take it, so push the slider's value through again
+        if self._volume_slider is not None:
+            self.playback_manager.set_volume(self._volume_slider.value())
+
+        if self.toolbar is not None:
+            self.toolbar.set_play_button_enabled(True)
+        self.status_bar_widget.update_status("Welcome to Modern YouTube Player")
 
         # Check if streaming was disabled due to initialization issues
-        if hasattr(self.vlc_player, "_streaming_disabled_on_init"):
+        if self.vlc_player.streaming_disabled_on_init():
             self.logger.warning("Streaming was disabled during VLC initialization")
-            QMessageBox.warning(
-                self,
-                "Streaming Disabled",
-                "Audio streaming was disabled during VLC initialization.\n"
-                "You can try enabling it again from the video controls.",
+            self.status_bar_widget.update_status("Audio streaming disabled (see logs)")
+            # Non-modal, so a broken audio setup never blocks startup
+            QTimer.singleShot(
+                0,
+                lambda: self._show_banner(
+                    "Streaming Disabled",
+                    "Audio streaming was disabled during VLC initialization. "
+                    "You can try enabling it again from the video controls.",
+                ),
             )
 
-        # Setup UI and connections
-        self.setup_ui()
-        self.apply_theme()
-        self.setup_shortcuts()
-        self.setup_manager_connections()  # After UI components are created
+        # Play a URL given on the command line as soon as VLC can take it
+        if self._pending_url:
+            self._pending_url = None
+            self.play_video_thread()
+
+    def _show_banner(self, title, message):
+        """
+        Show a dismissible notification banner below the toolbar.
+
+        Args:
+            title: Short bold heading
+            message: Notification text
+        """
+        if not PYSIDE6_AVAILABLE or self._main_layout is None:
+            return
 
-        # Load settings and show welcome
-        self.load_settings()
-        self.load_playlists()
+        self._dismiss_banner()
 
-        # Update history tab with loaded data
-        self.update_history_tab()
-        self.status_bar_widget.update_status("Welcome to Modern YouTube Player")
+        banner = QWidget(self)
+        banner.setObjectName("notificationBanner")
+        layout = QHBoxLayout(banner)
+        layout.setContentsMargins(12, 6, 6, 6)
+
+        label = QLabel(f"<b>{title}</b> {message}", banner)
+        label.setWordWrap(True)
+        layout.addWidget(label, 1)
+
+        close_button = QPushButton("✕", banner)
+        close_button.setObjectName("bannerCloseButton")
+        close_button.setToolTip("Dismiss")
+        close_button.clicked.connect(self._dismiss_banner)
+        layout.addWidget(close_button)
+
+        # Directly below the toolbar
+        self._main_layout.insertWidget(1, banner)
+        self._banner = banner
+
+    def _dismiss_banner(self):
+        """Remove the notification banner, if one is showing."""
+        if self._banner is not None:
+            self._banner.deleteLater()
+            self._banner = None
 
     def apply_theme(self):
         """Apply light theme to the application."""
-        from .theme import ThemeManager
-
         theme_manager = ThemeManager()
-        theme_manager.apply_theme(self)
+        app = QApplication.instance()
+        if app is not None:
+            # One application-wide stylesheet, parsed once by Qt
+            theme_manager.apply_global_theme(app)
+        else:
+            theme_manager.apply_theme(self)
 
     def setup_ui(self):
         """Setup the modern user interface using extracted components."""
@@ -377,15 +631,14 @@ class ModernYouTubePlayer(QMainWindow):
         main_layout = QVBoxLayout(central_widget)
         main_layout.setSpacing(STANDARD_SPACING)
         main_layout.setContentsMargins(0, 0, 0, 0)
+        self._main_layout = main_layout
 
         # Create UI components using extracted classes
         self._create_toolbar(main_layout)
         self._create_player_widget(main_layout)
         self._create_status_bar()
         self._create_tab_container(main_layout)
-
-        # Setup video player embedding
-        self.setup_vlc_embedding()
+        main_layout.addWidget(self._create_separator(1))  # Above the status bar
 
         # Connect component signals
         self._connect_component_signals()
@@ -396,21 +649,37 @@ class ModernYouTubePlayer(QMainWindow):
             return
 
         # Toolbar signals - check existence
-        if hasattr(self, "toolbar") and self.toolbar:
+        if self.toolbar is not None:
             self.toolbar.play_requested.connect(self._on_toolbar_play_requested)
             self.toolbar.quick_add_requested.connect(self.quick_add_to_playlist)
             self.toolbar.settings_requested.connect(self.show_settings)
 
         # Video controls signals - check existence
-        if hasattr(self, "video_controls") and self.video_controls:
+        if self.video_controls is not None:
             self.video_controls.volume_changed.connect(self.change_volume)
             self.video_controls.progress_pressed.connect(self.on_progress_pressed)
             self.video_controls.progress_released.connect(self.on_progress_released)
             self.video_controls.progress_moved.connect(self.on_progress_moved)
-            if hasattr(self.video_controls, "stream_button"):
-                self.video_controls.stream_button.clicked.connect(self.toggle_streaming)
-            if hasattr(self.video_controls, "mute_button"):
-                self.video_controls.mute_button.clicked.connect(self.toggle_mute)
+            self.video_controls.mute_button.clicked.connect(self.toggle_mute)
+            stream_button = getattr(self.video_controls, "stream_button", None)
+            if stream_button is not None:
+                stream_button.clicked.connect(self.toggle_streaming)
+
+        # Transcript auto-scroll toggle
+        if self.transcript_tab is not None:
+            self._auto_scroll_enabled = self.transcript_tab.auto_scroll_check.isChecked()
+            self.transcript_tab.auto_scroll_check.toggled.connect(self._set_auto_scroll)
+
+        # Only sync the transcript while its tab is showing
+        if self.tab_container is not None:
+            tabs = self.tab_container.tabs
+            self._on_tab_changed(tabs.currentIndex())
+            tabs.currentChanged.connect(self._on_tab_changed)
+
+    def _on_tab_changed(self, index):
+        """Track whether the transcript tab is the current tab."""
+        tabs = self.tab_container.tabs
+        self._transcript_tab_visible = tabs.widget(index) is self.transcript_tab
 
     def _on_toolbar_play_requested(self, url, quality):
         """Handle play request from toolbar."""
@@ -418,46 +687,85 @@ class ModernYouTubePlayer(QMainWindow):
         self.current_url = url
         self.play_video_thread()
 
-    def update_position(self):
-        """Update position display based on current playback position."""
-        if not self.playback_manager.is_playing():
+    def _on_time_changed(self, time):
+        """
+        Update position display from a VLC time-changed event.
+
+        Args:
+            time: Current playback time in milliseconds
+        """
+        # Don't fight the user while the progress slider is being dragged
+        if self._slider_pressed:
             return
 
-        position = self.playback_manager.get_position()
         length = self.playback_manager.get_length()
-        time = self.playback_manager.get_time()
-
         if length > 0:
-            position_value = int(position * 1000)
-            self.video_controls.progress_slider.setValue(position_value)
+            # The slider works in milliseconds; its range follows the video
+            if length != self._progress_length:
+                self._set_progress_length(length)
+            self.video_controls.progress_slider.setValue(time)
 
             self.video_controls.current_time_label.setText(format_time(time // 1000))
-            self.video_controls.total_time_label.setText(format_time(length // 1000))
 
             # Auto-scroll transcript if enabled
             if (
-                self.transcript_tab.auto_scroll_check.isChecked()
-                and self.transcript_manager.get_current_transcript_data()
+                self._transcript_tab_visible
+                and self._auto_scroll_enabled
+                and self._has_transcript
             ):
                 self.sync_transcript_to_time(time // 1000)
 
+    def _set_progress_length(self, length):
+        """
+        Resize the progress slider range to the video length.
+
+        Args:
+            length: Video length in milliseconds
+        """
+        self._progress_length = length
+        slider = self.video_controls.progress_slider
+        slider.setRange(0, length)
+        slider.setPageStep(max(1, length // 100))
+        self.video_controls.total_time_label.setText(format_time(length // 1000))
+
     def _create_toolbar(self, main_layout):
         """Create toolbar using extracted Toolbar component."""
-        from .components.toolbar import Toolbar
-
         self.toolbar = Toolbar(self)
-        main_layout.addWidget(self.toolbar)
+
+        # Keep the separator flush with the toolbar despite the main spacing
+        header_layout = QVBoxLayout()
+        header_layout.setSpacing(0)
+        header_layout.addWidget(self.toolbar)
+        header_layout.addWidget(self._create_separator(2))
+        main_layout.addLayout(header_layout)
+
+    def _create_separator(self, thickness):
+        """
+        Create a horizontal hairline.
+
+        A plain filled widget is painted far more cheaply by the style sheet
+        engine than a single-side border on the neighbouring widget.
+
+        Args:
+            thickness: Line height in pixels
+
+        Returns:
+            The separator widget
+        """
+        separator = QFrame(self)
+        separator.setObjectName("separator")
+        separator.setFixedHeight(thickness)
+        return separator
 
     def _create_player_widget(self, main_layout):
         """Create player widget using extracted PlayerWidget component."""
-        from .components.player_widget import PlayerWidget
-
         self.player_widget = PlayerWidget(self)
         main_layout.addWidget(self.player_widget, 2)
 
         # Get references to nested components for compatibility
         self.video_frame = self.player_widget.get_video_frame()
         self.video_controls = self.player_widget.get_video_controls()
+        self._volume_slider = self.video_controls.volume_slider
 
         # Connect video controls callbacks
         self.video_controls.set_callbacks(
@@ -473,13 +781,11 @@ class ModernYouTubePlayer(QMainWindow):
         Args:
             visible: True to show the placeholder, False to hide it
         """
-        if hasattr(self, "player_widget"):
+        if self.player_widget is not None:
             self.player_widget.set_placeholder_visible(visible)
 
     def _create_status_bar(self):
         """Create status bar using extracted StatusBarWidget component."""
-        from .components.status_bar_widget import StatusBarWidget
-
         self.status_bar_widget = StatusBarWidget(self.statusBar())
 
         # Keep references for compatibility
@@ -488,7 +794,7 @@ class ModernYouTubePlayer(QMainWindow):
 
     def setup_vlc_embedding(self):
         """Setup VLC player embedding in video frame."""
-        if self.vlc_player and hasattr(self, "player_widget"):
+        if self.player_widget is not None:
             success = self.player_widget.setup_vlc_embedding(self.vlc_player)
             if success:
                 self.logger.info("VLC player embedded successfully")
@@ -496,90 +802,113 @@ class ModernYouTubePlayer(QMainWindow):
                 self.logger.warning("VLC player embedding failed")
 
     def setup_manager_connections(self):
-        """Connect manager signals to UI handlers."""
-        try:
-            # Playback manager connections
-            self.playback_manager.playback_started.connect(self.on_playback_started)
-            self.playback_manager.playback_stopped.connect(self.on_playback_stopped)
-            self.playback_manager.playback_paused.connect(self.on_playback_paused)
-            self.playback_manager.playback_error.connect(self.on_playback_error)
-            self.playback_manager.position_changed.connect(self.on_position_changed)
-            self.playback_manager.volume_changed.connect(self.on_volume_changed)
+        """Connect manager signals to UI handlers.
 
-            # Transcript manager connections
-            self.transcript_manager.transcript_ready.connect(self.on_transcript_ready)
-            self.transcript_manager.transcript_error.connect(self.on_transcript_error)
+        Connections are declared as (source, signal name, slot) entries; a
+        missing source or signal is logged and skipped without affecting
+        the remaining connections.
+        """
+        if not PYSIDE6_AVAILABLE:
+            return
 
+        connections = (
+            # Playback manager connections
+            (self.playback_manager, "playback_started", self.on_playback_started),
+            (self.playback_manager, "playback_stopped", self.on_playback_stopped),
+            (self.playback_manager, "playback_paused", self.on_playback_paused),
+            (self.playback_manager, "playback_error", self.on_playback_error),
+            (self.playback_manager, "position_changed", self.on_position_changed),
+            (self.playback_manager, "time_changed", self._on_time_changed),
+            (self.playback_manager, "volume_changed", self.on_volume_changed),
+            # Transcript manager connections
+            (self.transcript_manager, "transcript_ready", self.on_transcript_ready),
+            (self.transcript_manager, "transcript_error", self.on_transcript_error),
+            (self.transcript_manager, "transcript_cleared", self.on_transcript_cleared),
             # Streaming manager connections
-            self.streaming_manager.streaming_enabled.connect(self.on_streaming_enabled)
-            self.streaming_manager.streaming_disabled.connect(
-                self.on_streaming_disabled
-            )
+            (self.streaming_manager, "streaming_enabled", self.on_streaming_enabled),
+            (self.streaming_manager, "streaming_disabled", self.on_streaming_disabled),
+            # Tab signal connections
+            (self.playlist_tab, "playlist_item_selected", self.play_playlist_item),
+            (self.playlist_tab, "playlist_cleared", self.on_playlist_cleared),
+            (self.transcript_tab, "transcript_fetch_requested", self.fetch_transcript),
+            (self.transcript_tab, "transcript_seek_requested", self.seek_to_time),
+            (self.history_tab, "play_from_history_requested", self.play_from_history),
+            (self.history_tab, "clear_history_requested", self.clear_history),
+            (self.history_tab, "history_changed", self._on_history_changed),
+        )
 
-            # Tab signal connections - check existence
-            if hasattr(self, "playlist_tab") and self.playlist_tab:
-                self.playlist_tab.playlist_item_selected.connect(
-                    self.play_playlist_item
-                )
-                self.playlist_tab.playlist_cleared.connect(self.on_playlist_cleared)
-            if hasattr(self, "transcript_tab") and self.transcript_tab:
-                self.transcript_tab.transcript_fetch_requested.connect(
-                    self.fetch_transcript
-                )
-                self.transcript_tab.transcript_seek_requested.connect(self.seek_to_time)
-            if hasattr(self, "history_tab") and self.history_tab:
-                self.history_tab.play_from_history_requested.connect(
-                    self.play_from_history
-                )
-                self.history_tab.clear_history_requested.connect(self.clear_history)
-        except AttributeError as e:
-            self.logger.warning(f"Failed to connect some manager signals: {e}")
+        connected = 0
+        skipped = []
+        for source, signal_name, slot in connections:
+            signal = getattr(source, signal_name, None)
+            if signal is None:
+                skipped.append(signal_name)
+                continue
+            signal.connect(slot)
+            connected += 1
+
+        self.logger.debug(f"Connected {connected} manager signals")
+        if skipped:
+            self.logger.warning(
+                f"Skipped missing manager signals: {', '.join(skipped)}"
+            )
 
     def setup_shortcuts(self):
         """Configure keyboard shortcuts."""
-        if PYSIDE6_AVAILABLE:
-            # Playback shortcuts
-            QShortcut(QKeySequence("Space"), self).activated.connect(
-                self.toggle_play_pause
-            )
-            QShortcut(QKeySequence("Escape"), self).activated.connect(
-                self.exit_fullscreen
-            )
-            QShortcut(QKeySequence("F"), self).activated.connect(
-                self.toggle_video_fullscreen
-            )
-            QShortcut(QKeySequence("M"), self).activated.connect(self.toggle_mute)
+        if not PYSIDE6_AVAILABLE:
+            return
 
-            # Seek shortcuts
-            QShortcut(QKeySequence("Left"), self).activated.connect(
-                lambda: self.seek_relative(-10)
-            )
-            QShortcut(QKeySequence("Right"), self).activated.connect(
-                lambda: self.seek_relative(10)
-            )
-            QShortcut(QKeySequence("Shift+Left"), self).activated.connect(
-                lambda: self.seek_relative(-60)
-            )
-            QShortcut(QKeySequence("Shift+Right"), self).activated.connect(
-                lambda: self.seek_relative(60)
-            )
+        # Keep references so the shortcuts stay alive with the window
+        self._shortcuts = {}
+        for key, method_name in self._SHORTCUTS:
+            shortcut = QShortcut(QKeySequence(key), self)
+            shortcut.activated.connect(getattr(self, method_name))
+            self._shortcuts[method_name] = shortcut
 
-            # Volume shortcuts
-            QShortcut(QKeySequence("Up"), self).activated.connect(
-                lambda: self.change_volume(
-                    self.video_controls.volume_slider.value() + 5
-                )
-            )
-            QShortcut(QKeySequence("Down"), self).activated.connect(
-                lambda: self.change_volume(
-                    self.video_controls.volume_slider.value() - 5
-                )
-            )
+    def rebind_shortcut(self, method_name, key):
+        """
+        Change the key sequence of an existing shortcut.
+
+        Args:
+            method_name: Handler method name from _SHORTCUTS
+            key: New key sequence, e.g. "Ctrl+Right"
+
+        Returns:
+            True if the shortcut was rebound, False otherwise
+        """
+        shortcut = self._shortcuts.get(method_name)
+        if shortcut is None:
+            return False
+
+        shortcut.setKey(QKeySequence(key))
+        return True
+
+    def _seek_backward(self):
+        """Seek back 10 seconds."""
+        self.seek_relative(-10)
+
+    def _seek_forward(self):
+        """Seek forward 10 seconds."""
+        self.seek_relative(10)
+
+    def _seek_backward_long(self):
+        """Seek back 60 seconds."""
+        self.seek_relative(-60)
+
+    def _seek_forward_long(self):
+        """Seek forward 60 seconds."""
+        self.seek_relative(60)
+
+    def _volume_up(self):
+        """Raise volume by 5."""
+        self.change_volume(self._volume_slider.value() + 5)
+
+    def _volume_down(self):
+        """Lower volume by 5."""
+        self.change_volume(self._volume_slider.value() - 5)
 
     def _create_tab_container(self, main_layout):
         """Create tab container using extracted TabContainer component."""
-        from .components.tab_container import TabContainer
-
         self.tab_container = TabContainer(self)
         main_layout.addWidget(self.tab_container, 1)
 
@@ -595,14 +924,15 @@ class ModernYouTubePlayer(QMainWindow):
     # Core functionality methods
     def play_video_thread(self):
         """Start video playback using the PlaybackManager."""
-        from ..exceptions import SecurityError, ValidationError
-        from ..validators import URLValidator
-
         # Get URL from toolbar or use stored URL
-        url = getattr(self, "current_url", None) or self.toolbar.get_url()
+        url = self.current_url or self.toolbar.get_url()
         if not url:
             return
 
+        if not self._backend_ready:
+            self.status_bar_widget.update_status("Initializing backend...")
+            return
+
         self.logger.info(f"Starting video playback: {url}")
 
         # Show progress
@@ -624,8 +954,7 @@ class ModernYouTubePlayer(QMainWindow):
         if success:
             # Update UI
             self.toolbar.set_play_button_enabled(False)
-            if hasattr(self.transcript_tab, "fetch_transcript_button"):
-                self.transcript_tab.fetch_transcript_button.setEnabled(True)
+            self.transcript_tab.fetch_transcript_button.setEnabled(True)
         else:
             self.logger.warning("Failed to start video playback")
             self.status_bar_widget.stop_loading("Failed to load video")
@@ -639,13 +968,12 @@ class ModernYouTubePlayer(QMainWindow):
                 self.playback_manager.pause()
         else:
             # If no video is loaded, try to play from URL entry
-            if hasattr(self, "current_url") and self.current_url:
+            if self.current_url:
                 self.playback_manager.play_url(self.current_url)
 
     def stop_video(self):
         """Stop video playback."""
         self.playback_manager.stop()
-        self.position_timer.stop()
 
     def previous_video(self):
         """Play previous video in playlist."""
@@ -672,21 +1000,24 @@ class ModernYouTubePlayer(QMainWindow):
             self.playback_manager.seek_time(int(time_seconds))
 
     def change_volume(self, volume):
-        """Change playback volume."""
+        """Change playback volume.
+
+        The slider is synced from playback_manager.volume_changed, so it is
+        not touched here to avoid a second round-trip through valueChanged.
+        """
         self.playback_manager.set_volume(volume)
-        self.video_controls.volume_slider.setValue(volume)
 
     def toggle_mute(self):
         """Toggle mute state."""
         if self.is_muted:
             self.playback_manager.set_volume(self.volume_before_mute)
             self.is_muted = False
-            self.video_controls.mute_button.setText("🔊")
+            self._set_button_text(self.video_controls.mute_button, "🔊")
         else:
             self.volume_before_mute = self.playback_manager.get_volume()
             self.playback_manager.set_volume(0)
             self.is_muted = True
-            self.video_controls.mute_button.setText("🔇")
+            self._set_button_text(self.video_controls.mute_button, "🔇")
 
     def toggle_streaming(self):
         """Toggle audio streaming."""
@@ -711,20 +1042,23 @@ class ModernYouTubePlayer(QMainWindow):
         """Exit fullscreen mode."""
         self.player_widget.exit_fullscreen(self.player_widget)
 
+    @staticmethod
+    def _set_button_text(button, text):
+        """Set a button's text, skipping the relayout when it is unchanged."""
+        if button.text() != text:
+            button.setText(text)
+
     # Event handlers
     def on_playback_started(self, video_info=None):
         """Handle playback started event."""
         self.logger.info("Playback started")
-        self.video_controls.play_pause_button.setText("⏸")
+        self._set_button_text(self.video_controls.play_pause_button, "⏸")
         self.toolbar.set_play_button_enabled(True)
         self.status_bar_widget.stop_loading()
 
         # Hide video placeholder when playback starts
         self._set_video_placeholder_visibility(False)
 
-        # Start position timer
-        self.position_timer.start(POSITION_UPDATE_INTERVAL_MS)
-
         # Update video info
         if video_info:
             self.current_video_info = video_info
@@ -735,8 +1069,8 @@ class ModernYouTubePlayer(QMainWindow):
     def on_playback_stopped(self):
         """Handle playback stopped event."""
         self.logger.info("Playback stopped")
-        self.video_controls.play_pause_button.setText("▶")
-        self.position_timer.stop()
+        self._set_button_text(self.video_controls.play_pause_button, "▶")
+        self._progress_length = 0
 
         # Show video placeholder when playback stops
         self._set_video_placeholder_visibility(True)
@@ -746,12 +1080,10 @@ class ModernYouTubePlayer(QMainWindow):
     def on_playback_paused(self, is_paused):
         """Handle playback paused/resumed event."""
         if is_paused:
-            self.video_controls.play_pause_button.setText("▶")
-            self.position_timer.stop()
+            self._set_button_text(self.video_controls.play_pause_button, "▶")
             self.update_status("Paused")
         else:
-            self.video_controls.play_pause_button.setText("⏸")
-            self.position_timer.start(POSITION_UPDATE_INTERVAL_MS)
+            self._set_button_text(self.video_controls.play_pause_button, "⏸")
             self.update_status("Playing")
 
     def on_playback_error(self, error_message):
@@ -761,12 +1093,17 @@ class ModernYouTubePlayer(QMainWindow):
 
     def on_position_changed(self, position, length):
         """Handle position change event."""
-        # This is handled by update_position timer method
+        # Position display is driven by playback_manager.time_changed
         pass
 
     def on_volume_changed(self, volume):
         """Handle volume change event."""
-        self.video_controls.volume_slider.setValue(volume)
+        # set_volume blocks slider signals so this doesn't re-enter change_volume
+        self.video_controls.set_volume(volume)
+        if volume == self._saved_volume:
+            return
+        # Restarting the timer coalesces a whole slider drag into one write
+        self._settings_save_timer.start()
 
     def on_fetch_error(self, error_message):
         """Handle fetch errors with user feedback."""
@@ -789,9 +1126,18 @@ class ModernYouTubePlayer(QMainWindow):
 
     def on_transcript_ready(self, transcript_data):
         """Handle transcript ready event."""
+        self._has_transcript = bool(transcript_data)
         self.transcript_tab.set_transcript_data(transcript_data)
         self.update_status("Transcript loaded")
 
+    def on_transcript_cleared(self):
+        """Handle transcript cleared event."""
+        self._has_transcript = False
+
+    def _set_auto_scroll(self, enabled):
+        """Track the transcript auto-scroll checkbox state."""
+        self._auto_scroll_enabled = enabled
+
     def on_transcript_error(self, error_message):
         """Handle transcript error event."""
         self.logger.warning(f"Transcript error: {error_message}")
@@ -809,21 +1155,32 @@ class ModernYouTubePlayer(QMainWindow):
     # Progress bar handlers
     def on_progress_pressed(self):
         """Handle progress bar press."""
-        self.position_timer.stop()
+        self._slider_pressed = True
 
     def on_progress_released(self):
         """Handle progress bar release."""
-        if self.playback_manager.is_playing():
-            self.position_timer.start(POSITION_UPDATE_INTERVAL_MS)
+        self._slider_pressed = False
+
+        # Flush any seek still waiting on the debounce timer
+        self._seek_debounce.stop()
+        self._apply_pending_seek()
 
     def on_progress_moved(self, value):
         """Handle progress bar movement."""
         if self.playback_manager.is_playing():
-            length = self.playback_manager.get_length()
-            if length > 0:
-                position = value / 1000.0  # Convert from slider range
-                new_time = int(position * length)
-                self.playback_manager.set_time(new_time)
+            if self._progress_length > 0:
+                # Slider values are already in milliseconds
+                self._pending_seek = value
+                self._seek_debounce.start()
+
+    def _apply_pending_seek(self):
+        """Issue the most recent seek requested by the progress slider."""
+        if self._pending_seek is None:
+            return
+
+        new_time = self._pending_seek
+        self._pending_seek = None
+        self.playback_manager.set_time(new_time)
 
     # Utility methods
     def update_video_info(self, video_info):
@@ -840,9 +1197,7 @@ class ModernYouTubePlayer(QMainWindow):
     def quick_add_to_playlist(self):
         """Quick add current URL to playlist."""
         url = self.toolbar.get_url()
-        if url and hasattr(self, "current_video_info"):
-            from ..models import PlaylistItem
-
+        if url and self.current_video_info is not None:
             item = PlaylistItem(
                 title=self.current_video_info.get("title", "Unknown"),
                 url=url,
@@ -887,7 +1242,7 @@ class ModernYouTubePlayer(QMainWindow):
     # Transcript handlers
     def fetch_transcript(self):
         """Fetch transcript for current video."""
-        if hasattr(self, "current_url") and self.current_url:
+        if self.current_url:
             self.transcript_manager.fetch_transcript(self.current_url)
             self.update_status("Fetching transcript...")
 
@@ -897,33 +1252,97 @@ class ModernYouTubePlayer(QMainWindow):
 
     # Settings management
     def load_settings(self):
-        """Load application settings."""
-        try:
-            # Load window geometry
-            geometry = self.settings_manager.get_setting("window_geometry")
-            if geometry:
-                self.restoreGeometry(geometry)
+        """
+        Load settings that must be applied before the window is shown.
 
-            # Load other settings
-            volume = self.settings_manager.get_setting("volume", DEFAULT_VOLUME)
-            self.change_volume(volume)
+        Window geometry is restored on first show and saved on close by
+        GeometryHelper; volume and history are loaded by
+        _start_startup_data_load().
+        """
+        try:
+            GeometryHelper.instance().enable(self, "window_geometry")
 
             self.logger.info("Settings loaded successfully")
         except Exception as e:
             self.logger.error(f"Failed to load settings: {e}")
 
-    def save_settings(self):
-        """Save application settings."""
+    def _start_startup_data_load(self):
+        """Read the remaining startup settings in a worker thread."""
+        if not PYSIDE6_AVAILABLE:
+            self._apply_startup_data(self._read_startup_data(self.settings_manager))
+            return
+
+        self.startup_data_ready.connect(self._apply_startup_data)
+        self.thread_manager.submit_task(self._load_startup_data_task)
+
+    def _load_startup_data_task(self):
+        """Worker thread entry point for reading startup settings."""
+        # QSettings objects must not be shared between threads
+        settings_manager = SettingsManager(
+            QSettings("ModernYouTubePlayer", "Settings")
+        )
+        # Delivered to the UI thread through a queued connection
+        self.startup_data_ready.emit(self._read_startup_data(settings_manager))
+
+    def _read_startup_data(self, settings_manager):
+        """
+        Read volume and history without touching any widgets.
+
+        Args:
+            settings_manager: SettingsManager owned by the calling thread
+
+        Returns:
+            Dictionary with "volume" and "history" keys
+        """
+        data = {"volume": DEFAULT_VOLUME, "history": []}
+        try:
+            data["volume"] = int(
+                settings_manager.get_setting("volume", DEFAULT_VOLUME)
+            )
+        except Exception as e:
+            self.logger.error(f"Failed to load volume: {e}")
         try:
-            # Save window geometry
-            self.settings_manager.set_setting("window_geometry", self.saveGeometry())
+            data["history"] = settings_manager.load_video_history()
+        except Exception as e:
+            self.logger.error(f"Failed to load history: {e}")
+        return data
 
-            # Save other settings
-            if hasattr(self, "video_controls") and hasattr(
-                self.video_controls, "volume_slider"
-            ):
-                volume = self.video_controls.volume_slider.value()
-                self.settings_manager.set_setting("volume", volume)
+    def _apply_startup_data(self, data):
+        """
+        Apply settings read by _read_startup_data() on the UI thread.
+
+        Args:
+            data: Dictionary with "volume" and "history" keys
+        """
+        self._saved_volume = data["volume"]
+        self.change_volume(data["volume"])
+        self._merge_loaded_history(data["history"])
+
+    def _merge_loaded_history(self, history):
+        """
+        Merge saved history behind anything played since startup.
+
+        Args:
+            history: List of video info dictionaries read from settings
+        """
+        self._history_loaded = True
+        if not history:
+            return
+
+        current = self.history_tab.get_history_data()
+        current_urls = {video.get("url") for video in current}
+        self.history_tab.load_history_data(
+            current + [v for v in history if v.get("url") not in current_urls]
+        )
+
+    def save_settings(self):
+        """Save application settings and write them to disk once."""
+        self._settings_save_timer.stop()
+        try:
+            if self._volume_slider is not None:
+                self._saved_volume = self._volume_slider.value()
+                self.settings_manager.set_setting("volume", self._saved_volume)
+            self.settings_manager.sync()
 
             self.logger.info("Settings saved successfully")
         except Exception as e:
@@ -936,24 +1355,58 @@ class ModernYouTubePlayer(QMainWindow):
 
     def update_history_tab(self):
         """Update history tab with loaded data."""
-        # History is managed by the history tab itself
-        pass
+        try:
+            history = self.settings_manager.load_video_history()
+        except Exception as e:
+            self.logger.error(f"Failed to load history: {e}")
+            return
+
+        self._merge_loaded_history(history)
+
+    def _on_history_changed(self):
+        """Schedule a history write, coalescing changes in the meantime."""
+        self._history_dirty = True
+        if not self._history_flush_timer.isActive():
+            self._history_flush_timer.start()
+
+    def flush_history(self):
+        """Write pending history changes to settings."""
+        self._history_flush_timer.stop()
+        if not self._history_dirty:
+            return
+
+        try:
+            # Never overwrite saved history that hasn't been loaded yet
+            if not self._history_loaded:
+                self._merge_loaded_history(self.settings_manager.load_video_history())
+            self.settings_manager.save_video_history(
+                self.history_tab.get_history_data()
+            )
+            self._history_dirty = False
+        except Exception as e:
+            self.logger.error(f"Failed to save history: {e}")
 
     def load_url(self, url):
-        """Load URL from command line or external source."""
+        """
+        Load URL from command line or external source and auto-play it.
+
+        Playback starts from _on_backend_ready() if VLC is still being
+        initialized, instead of after a fixed delay.
+        """
         if url:
             self.toolbar.set_url(url)
-            # Auto-play if URL is provided
-            QTimer.singleShot(
-                1000, self.play_video_thread
-            )  # Small delay to ensure UI is ready
+            if self._backend_ready:
+                # Let the window paint before playback setup starts
+                self._autoplay_timer.start()
+            else:
+                self._pending_url = url
 
     def resizeEvent(self, event):
         """Handle window resize events to maintain proper layout."""
         super().resizeEvent(event)
 
         # Maintain aspect ratio for video frame if needed
-        if hasattr(self, "video_frame") and self.video_frame:
+        if self.video_frame is not None:
             # Allow video frame to scale naturally with the window
             # The layout system will handle the sizing automatically
             pass
@@ -962,8 +1415,13 @@ class ModernYouTubePlayer(QMainWindow):
         """Handle application shutdown."""
         self.logger.info("Application closing")
 
+        # Drop any auto-play that hasn't started yet
+        self._autoplay_timer.stop()
+        self._pending_url = None
+
         # Save settings
         self.save_settings()
+        self.flush_history()
 
         # Stop playback
         if self.playback_manager.is_playing():
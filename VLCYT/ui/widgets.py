@@ -5,8 +5,13 @@ This module contains custom Qt widgets used throughout the application.
 """
 
 try:
-    from PySide6.QtCore import Property, QEasingCurve, QPropertyAnimation, Qt
-    from PySide6.QtGui import QColor, QPainter
+    from PySide6.QtCore import (
+        Property,
+        QAbstractAnimation,
+        QEasingCurve,
+        QPropertyAnimation,
+        Qt,
+    )
     from PySide6.QtWidgets import QPushButton
 
     PYSIDE6_AVAILABLE = True
@@ -63,12 +68,6 @@ except ImportError:
 
         return decorator
 
-    class QPainter:
-        pass
-
-    class QColor:
-        pass
-
     class QPushButton:
         def __init__(self, parent=None):
             self.clicked = DummySignal()
@@ -169,18 +168,28 @@ class ModernButton(QPushButton):
             self._hover_progress = value
             self.update()
 
+        def _animate_hover(self, target):
+            """Animate hover_progress towards target unless already there."""
+            animation = self._animation
+            # A running animation may be heading the other way; retarget it
+            if (
+                animation.state() != QAbstractAnimation.State.Running
+                and self._hover_progress == target
+            ):
+                return
+            animation.stop()
+            animation.setStartValue(self._hover_progress)
+            animation.setEndValue(target)
+            animation.start()
+
         def enterEvent(self, event):
             """Handle mouse enter event."""
-            self._animation.setStartValue(self._hover_progress)
-            self._animation.setEndValue(1.0)
-            self._animation.start()
+            self._animate_hover(1.0)
             super().enterEvent(event)
 
         def leaveEvent(self, event):
             """Handle mouse leave event."""
-            self._animation.setStartValue(self._hover_progress)
-            self._animation.setEndValue(0.0)
-            self._animation.start()
+            self._animate_hover(0.0)
             super().leaveEvent(event)
 
     else:
@@ -5,13 +5,51 @@ This module contains formatting utilities for time, URLs, and other data.
 """
 
 import re
+from functools import lru_cache
 from typing import List, Optional
 
-
+# Compiled once at import instead of on every call
+_YOUTUBE_URL_RE = re.compile(
+    r"(?:https?://)?(?:www\.)?"
+    r"(?:youtube\.com/(?:watch\?v=|playlist\?list=|shorts/)|"
+    r"youtu\.be/)([a-zA-Z0-9_-]+)"
+)
+# Standard, short (youtu.be) and Shorts URLs in a single alternation
+_VIDEO_ID_RE = re.compile(
+    r"(?:https?://)?(?:www\.)?"
+    r"(?:youtube\.com/(?:watch\?v=|shorts/)|youtu\.be/)([a-zA-Z0-9_-]+)"
+)
+_PLAYLIST_ID_RE = re.compile(
+    r"(?:https?://)?(?:www\.)?youtube\.com/playlist\?list=([a-zA-Z0-9_-]+)"
+)
+_YT_SUFFIX_RE = re.compile(r"\s*-\s*YouTube\s*$")
+_HTML_ENTITIES = {
+    "&amp;": "&",
+    "&lt;": "<",
+    "&gt;": ">",
+    "&quot;": '"',
+    "&#39;": "'",
+}
+_HTML_ENTITY_RE = re.compile("|".join(map(re.escape, _HTML_ENTITIES)))
+_ELLIPSIS = "\u2026"
+
+# (unit, divisor, decimal places) for format_file_size, from KB upwards
+_FILE_SIZE_UNITS = (
+    ("KB", 1024, 1),
+    ("MB", 1024**2, 1),
+    ("GB", 1024**3, 2),
+)
+# Characters not allowed in filenames, each mapped to an underscore
+_INVALID_FILENAME_CHARS = str.maketrans(dict.fromkeys('\\/*?:"<>|', "_"))
+
+
+@lru_cache(maxsize=8192)
 def format_time(seconds: int) -> str:
     """
     Format time in seconds to hh:mm:ss or mm:ss format.
 
+    Results are cached; UI refreshes format the same seconds repeatedly.
+
     Args:
         seconds: Time in seconds
 
@@ -21,13 +59,14 @@ def format_time(seconds: int) -> str:
     if seconds < 0:
         return "00:00"
 
+    # Most timestamps are under an hour and need no hours split
+    if seconds < 3600:
+        minutes, seconds = divmod(seconds, 60)
+        return f"{minutes:02d}:{seconds:02d}"
+
     hours, remainder = divmod(seconds, 3600)
     minutes, seconds = divmod(remainder, 60)
-
-    if hours > 0:
-        return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-    else:
-        return f"{minutes:02d}:{seconds:02d}"
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
 
 
 def parse_playlist_urls(text: str) -> List[str]:
@@ -40,29 +79,27 @@ def parse_playlist_urls(text: str) -> List[str]:
     Returns:
         List of extracted URLs
     """
-    # Handle various YouTube URL formats
-    youtube_pattern = re.compile(
-        r"(?:https?://)?(?:www\.)?"
-        r"(?:youtube\.com/(?:watch\?v=|playlist\?list=|shorts/)|"
-        r"youtu\.be/)([a-zA-Z0-9_-]+)"
-    )
-
     urls = []
 
-    # Handle multi-line input
-    for line in text.split("\n"):
+    # Handle multi-line input, including \r\n line endings
+    for line in text.splitlines():
         line = line.strip()
 
         # Skip empty lines
         if not line:
             continue
 
-        # Try to match YouTube URLs
-        match = youtube_pattern.search(line)
+        # Every YouTube URL form contains "youtu"; other lines are kept
+        # only if they are plain http(s) URLs and never reach the regex
+        if "youtu" not in line:
+            if line.startswith(("http://", "https://")):
+                urls.append(line)
+            continue
+
+        match = _YOUTUBE_URL_RE.search(line)
         if match:
             # Extract full URL
-            start, end = match.span()
-            url = line[start:end]
+            url = match.group(0)
 
             # Ensure URL has proper scheme
             if not url.startswith(("http://", "https://")):
@@ -78,18 +115,16 @@ def parse_playlist_urls(text: str) -> List[str]:
 
 def truncate_text(text: str, max_length: int = 50) -> str:
     """
-    Truncate text to a maximum length, adding ellipsis if needed.
+    Truncate text to a maximum length, adding an ellipsis if needed.
 
     Args:
         text: Text to truncate
         max_length: Maximum length
 
     Returns:
-        Truncated text
+        Truncated text, ending in a single "…" character if shortened
     """
-    if len(text) <= max_length:
-        return text
-    return text[: max_length - 3] + "..."
+    return text if len(text) <= max_length else text[: max_length - 1] + _ELLIPSIS
 
 
 def format_file_size(size_bytes: int) -> str:
@@ -105,16 +140,10 @@ def format_file_size(size_bytes: int) -> str:
     if size_bytes < 1024:
         return f"{size_bytes} B"
 
-    size_kb = size_bytes / 1024
-    if size_kb < 1024:
-        return f"{size_kb:.1f} KB"
-
-    size_mb = size_kb / 1024
-    if size_mb < 1024:
-        return f"{size_mb:.1f} MB"
-
-    size_gb = size_mb / 1024
-    return f"{size_gb:.2f} GB"
+    # Unit index from the bit length: exact, unlike math.log at 1024**n
+    index = min((int(size_bytes).bit_length() - 1) // 10, len(_FILE_SIZE_UNITS))
+    unit, divisor, decimals = _FILE_SIZE_UNITS[index - 1]
+    return f"{size_bytes / divisor:.{decimals}f} {unit}"
 
 
 def extract_video_id(url: str) -> Optional[str]:
@@ -127,21 +156,8 @@ def extract_video_id(url: str) -> Optional[str]:
     Returns:
         Video ID or None if not found
     """
-    patterns = [
-        # Standard YouTube URL
-        r"(?:https?://)?(?:www\.)?youtube\.com/watch\?v=([a-zA-Z0-9_-]+)",
-        # Short YouTube URL
-        r"(?:https?://)?(?:www\.)?youtu\.be/([a-zA-Z0-9_-]+)",
-        # YouTube Shorts URL
-        r"(?:https?://)?(?:www\.)?youtube\.com/shorts/([a-zA-Z0-9_-]+)",
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
-
-    return None
+    match = _VIDEO_ID_RE.search(url)
+    return match.group(1) if match else None
 
 
 def extract_playlist_id(url: str) -> Optional[str]:
@@ -154,8 +170,7 @@ def extract_playlist_id(url: str) -> Optional[str]:
     Returns:
         Playlist ID or None if not found
     """
-    pattern = r"(?:https?://)?(?:www\.)?youtube\.com/playlist\?list=([a-zA-Z0-9_-]+)"
-    match = re.search(pattern, url)
+    match = _PLAYLIST_ID_RE.search(url)
 
     if match:
         return match.group(1)
@@ -174,14 +189,10 @@ def format_youtube_title(title: str) -> str:
         Formatted title
     """
     # Remove common YouTube patterns like "- YouTube" at the end
-    title = re.sub(r"\s*-\s*YouTube\s*$", "", title)
+    title = _YT_SUFFIX_RE.sub("", title)
 
-    # Replace HTML entities
-    title = title.replace("&amp;", "&")
-    title = title.replace("&lt;", "<")
-    title = title.replace("&gt;", ">")
-    title = title.replace("&quot;", '"')
-    title = title.replace("&#39;", "'")
+    # Replace HTML entities in a single pass
+    title = _HTML_ENTITY_RE.sub(lambda match: _HTML_ENTITIES[match.group(0)], title)
 
     return title.strip()
 
@@ -197,8 +208,7 @@ def sanitize_filename(filename: str) -> str:
         Sanitized filename
     """
     # Replace invalid filename characters with underscores
-    invalid_chars = r'[\\/*?:"<>|]'
-    sanitized = re.sub(invalid_chars, "_", filename)
+    sanitized = filename.translate(_INVALID_FILENAME_CHARS)
 
     # Remove leading/trailing whitespace and dots
     sanitized = sanitized.strip(". ")
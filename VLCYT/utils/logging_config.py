@@ -6,12 +6,12 @@ This module provides logging setup for the application.
 
 import datetime
 import logging
+import logging.handlers
 import os
 import sys
-from typing import Dict, Optional
+from typing import Optional
 
-# Global logger instances cache
-_loggers: Dict[str, logging.Logger] = {}
+from ..constants import FILE_LOG_BUFFER_CAPACITY
 
 
 def initialize_logging(
@@ -32,10 +32,12 @@ def initialize_logging(
     # Get root logger
     root_logger = logging.getLogger()
 
-    # Clear any existing handlers to avoid duplicates
-    if root_logger.handlers:
-        for handler in root_logger.handlers[:]:
-            root_logger.removeHandler(handler)
+    # Clear any existing handlers to avoid duplicates; closing a buffered
+    # file handler flushes its pending records to the old log file
+    while root_logger.handlers:
+        handler = root_logger.handlers[-1]
+        root_logger.removeHandler(handler)
+        handler.close()
 
     # Set log level
     root_logger.setLevel(log_level)
@@ -80,19 +82,25 @@ def initialize_logging(
         file_handler.setLevel(log_level)
         file_handler.setFormatter(formatter)
 
+        # Buffer records and write them in batches; warnings and errors
+        # flush immediately, and logging's exit hook flushes the rest
+        buffered_handler = logging.handlers.MemoryHandler(
+            capacity=FILE_LOG_BUFFER_CAPACITY,
+            flushLevel=logging.WARNING,
+            target=file_handler,
+        )
+        buffered_handler.setLevel(log_level)
+
         # Add file handler to root logger
-        root_logger.addHandler(file_handler)
+        root_logger.addHandler(buffered_handler)
 
         # Log the start message
         root_logger.info(f"Logging initialized for {app_name}")
         root_logger.info(f"Log file: {log_file}")
-    except Exception as e:
+    except OSError as e:
         root_logger.error(f"Failed to set up file logging: {e}")
         root_logger.warning("Continuing with console logging only")
 
-    # Cache the root logger
-    _loggers["root"] = root_logger
-
     # Return the root logger
     return root_logger
 
@@ -101,21 +109,15 @@ def get_logger(name: str) -> logging.Logger:
     """
     Get a logger with the specified name.
 
+    logging.getLogger() already caches loggers by name.
+
     Args:
         name: Logger name
 
     Returns:
         Logger instance
     """
-    # Check if logger already exists in cache
-    if name in _loggers:
-        return _loggers[name]
-
-    # Create and cache the logger
-    logger = logging.getLogger(name)
-    _loggers[name] = logger
-
-    return logger
+    return logging.getLogger(name)
 
 
 def set_log_level(level: int, logger_name: Optional[str] = None) -> None:
@@ -170,8 +172,10 @@ def get_log_file_path() -> Optional[str]:
     # Get the root logger
     root_logger = logging.getLogger()
 
-    # Check for file handlers
+    # Check for file handlers, including ones behind a buffer
     for handler in root_logger.handlers:
+        if isinstance(handler, logging.handlers.MemoryHandler):
+            handler = handler.target
         if isinstance(handler, logging.FileHandler):
             return handler.baseFilename
 
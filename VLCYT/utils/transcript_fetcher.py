@@ -4,6 +4,9 @@ Transcript fetcher utility for VLCYT.
 This module provides functionality to fetch video transcripts from YouTube.
 """
 
+import re
+from collections import OrderedDict
+from operator import itemgetter
 from typing import Any, Dict, List, Optional
 
 try:
@@ -14,8 +17,20 @@ except ImportError:
     TRANSCRIPT_API_AVAILABLE = False
     print("Warning: youtube-transcript-api not available")
 
+from ..constants import TRANSCRIPT_CACHE_SIZE
 from ..exceptions import NetworkError, ValidationError
 
+# Watch URLs capture up to the next query parameter, youtu.be, embed and
+# /v/ URLs up to the query string
+_VIDEO_ID_RE = re.compile(
+    r"(?:https?://)?(?:www\.)?"
+    r"(?:youtube\.com/watch\?v=([^&]+)"
+    r"|(?:youtu\.be/|youtube\.com/(?:embed|v)/)([^?]+))"
+)
+
+# The API always provides all three fields for every entry
+_ENTRY_FIELDS = itemgetter("start", "duration", "text")
+
 
 class TranscriptFetcher:
     """
@@ -25,11 +40,16 @@ class TranscriptFetcher:
     def __init__(self):
         """Initialize transcript fetcher."""
         self.available = TRANSCRIPT_API_AVAILABLE
+        # Formatted transcripts by video ID, least recently used first
+        self._cache: "OrderedDict[str, List[Dict[str, Any]]]" = OrderedDict()
 
     def fetch_transcript(self, video_url: str) -> List[Dict[str, Any]]:
         """
         Fetch transcript for a YouTube video.
 
+        The most recently used transcripts are kept in memory by video ID,
+        so fetching the same video again does not hit the network.
+
         Args:
             video_url: YouTube video URL
 
@@ -43,12 +63,36 @@ class TranscriptFetcher:
         if not self.available:
             raise NetworkError("Transcript API not available")
 
-        try:
-            # Extract video ID from URL
-            video_id = self._extract_video_id(video_url)
-            if not video_id:
-                raise ValidationError("Invalid YouTube URL")
+        # Extract video ID from URL
+        video_id = self._extract_video_id(video_url)
+        if not video_id:
+            raise ValidationError("Invalid YouTube URL")
+
+        entries = self._cache.get(video_id)
+        if entries is None:
+            entries = self._fetch_by_id(video_id)
+            self._cache[video_id] = entries
+            if len(self._cache) > TRANSCRIPT_CACHE_SIZE:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(video_id)
 
+        return entries
+
+    def _fetch_by_id(self, video_id: str) -> List[Dict[str, Any]]:
+        """
+        Download and format the transcript for a video ID.
+
+        Args:
+            video_id: YouTube video ID
+
+        Returns:
+            List of transcript entries with 'start', 'duration', 'text' keys
+
+        Raises:
+            NetworkError: If transcript fetching fails
+        """
+        try:
             # Fetch transcript
             transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
 
@@ -72,23 +116,15 @@ class TranscriptFetcher:
             transcript_data = transcript.fetch()
 
             # Format for consistency
-            formatted_data = []
-            for entry in transcript_data:
-                formatted_data.append(
-                    {
-                        "start": entry.get("start", 0),
-                        "duration": entry.get("duration", 0),
-                        "text": entry.get("text", "").strip(),
-                    }
-                )
-
-            return formatted_data
+            return [
+                {"start": start, "duration": duration, "text": text.strip()}
+                for start, duration, text in map(_ENTRY_FIELDS, transcript_data)
+            ]
 
+        except NetworkError:
+            raise
         except Exception as e:
-            if isinstance(e, (NetworkError, ValidationError)):
-                raise
-            else:
-                raise NetworkError(f"Failed to fetch transcript: {str(e)}")
+            raise NetworkError(f"Failed to fetch transcript: {str(e)}")
 
     def _extract_video_id(self, url: str) -> Optional[str]:
         """
@@ -100,20 +136,9 @@ class TranscriptFetcher:
         Returns:
             Video ID or None if extraction fails
         """
-        import re
-
-        # Various YouTube URL patterns
-        patterns = [
-            r"(?:https?://)?(?:www\.)?youtube\.com/watch\?v=([^&]+)",
-            r"(?:https?://)?(?:www\.)?youtu\.be/([^?]+)",
-            r"(?:https?://)?(?:www\.)?youtube\.com/embed/([^?]+)",
-            r"(?:https?://)?(?:www\.)?youtube\.com/v/([^?]+)",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
+        match = _VIDEO_ID_RE.search(url)
+        if match:
+            return match.group(1) or match.group(2)
 
         return None
 
@@ -5,30 +5,56 @@ Provides security-focused validation for user inputs.
 
 import re
 import urllib.parse
+from functools import lru_cache
 from typing import List, Optional
 
 from .exceptions import SecurityError, ValidationError
 
+# Characters and entities that suggest markup injection, found in one scan
+_SUSPICIOUS_RE = re.compile(r"[<>\"']|&(?:lt|gt|quot);")
+
+# Script injection markers in search queries, matched without lowercasing
+_QUERY_SCRIPT_RE = re.compile(r"<script|javascript:", re.IGNORECASE)
+
+# Well-known service ports a stream must not bind to
+_DANGEROUS_PORTS = frozenset({22, 23, 25, 53, 80, 110, 143, 443, 993, 995})
+
+# Characters not allowed in filenames, in the order they are reported
+_INVALID_FILENAME_CHARS = '<>:"|?*\\/'
+_INVALID_FILENAME_RE = re.compile(f"[{re.escape(_INVALID_FILENAME_CHARS)}]")
+
+# Device names Windows reserves regardless of extension
+_RESERVED_FILENAMES = frozenset(
+    {"CON", "PRN", "AUX", "NUL"}
+    | {f"COM{i}" for i in range(1, 10)}
+    | {f"LPT{i}" for i in range(1, 10)}
+)
+
 
 class URLValidator:
     """Validates YouTube URLs with security checks."""
 
     # Allowed YouTube domains
-    ALLOWED_DOMAINS = {
-        "youtube.com",
-        "www.youtube.com",
-        "m.youtube.com",
-        "youtu.be",
-        "www.youtu.be",
-    }
-
-    # YouTube URL patterns
-    YOUTUBE_PATTERNS = [
-        r"^https?://(www\.)?youtube\.com/watch\?v=([a-zA-Z0-9_-]{11})(&.*)?$",
-        r"^https?://(www\.)?youtube\.com/embed/([a-zA-Z0-9_-]{11})(\?.*)?$",
-        r"^https?://(www\.)?youtu\.be/([a-zA-Z0-9_-]{11})(\?.*)?$",
-        r"^https?://(m\.)?youtube\.com/watch\?v=([a-zA-Z0-9_-]{11})(&.*)?$",
-    ]
+    ALLOWED_DOMAINS = frozenset(
+        {
+            "youtube.com",
+            "www.youtube.com",
+            "m.youtube.com",
+            "youtu.be",
+            "www.youtu.be",
+        }
+    )
+
+    # YouTube URL patterns: watch (www./m.), embed and youtu.be, in one
+    # alternation so a URL is matched once; each branch captures the ID
+    YOUTUBE_URL_RE = re.compile(
+        r"^https?://(?:"
+        r"(?:www\.|m\.)?youtube\.com/watch\?v=([a-zA-Z0-9_-]{11})(?:&.*)?"
+        r"|(?:www\.)?youtube\.com/embed/([a-zA-Z0-9_-]{11})(?:\?.*)?"
+        r"|(?:www\.)?youtu\.be/([a-zA-Z0-9_-]{11})(?:\?.*)?"
+        r")$",
+        re.IGNORECASE,
+    )
 
     @classmethod
     def validate_youtube_url(cls, url: str) -> str:
@@ -48,6 +74,18 @@ class URLValidator:
         if not url or not isinstance(url, str):
             raise ValidationError("URL cannot be empty", field="url", value=str(url))
 
+        return cls._validate_youtube_url_cached(url)
+
+    @classmethod
+    @lru_cache(maxsize=512)
+    def _validate_youtube_url_cached(cls, url: str) -> str:
+        """
+        Validate a non-empty URL string, memoizing successful results.
+
+        Replaying from history or a playlist re-validates the same URLs;
+        validation is pure, so a cached normalized URL is equivalent.
+        Failures raise and are therefore never cached.
+        """
         url = url.strip()
 
         # Check for basic URL structure
@@ -55,15 +93,30 @@ class URLValidator:
             # Try adding https prefix
             url = f"https://{url}"
 
+        # Security checks on the raw string come first, so an injection
+        # attempt is reported as such even when it isn't a YouTube URL
+        cls._check_raw_security_issues(url)
+
+        # Every accepted form contains one of these; reject anything else
+        # before parsing, e.g. stray text pasted into a playlist
+        lowered = url.lower()
+        if "youtube.com/" not in lowered and "youtu.be/" not in lowered:
+            raise ValidationError(
+                "Only YouTube URLs are allowed", field="url", value=url
+            )
+
+        # Split once; the query check needs the query and the domain check
+        # needs the netloc. urlsplit skips urlparse's extra pass for
+        # ";params", which YouTube URLs never use
         try:
-            parsed = urllib.parse.urlparse(url)
+            parsed = urllib.parse.urlsplit(url)
         except Exception as e:
             raise ValidationError(
                 f"Invalid URL format: {str(e)}", field="url", value=url
             )
 
         # Security checks
-        cls._check_security_issues(parsed, url)
+        cls._check_security_issues(parsed)
 
         # Domain validation
         domain = parsed.netloc.lower()
@@ -74,18 +127,10 @@ class URLValidator:
                 value=url,
             )
 
-        # Pattern validation
-        if not any(
-            re.match(pattern, url, re.IGNORECASE) for pattern in cls.YOUTUBE_PATTERNS
-        ):
-            raise ValidationError("Invalid YouTube URL format", field="url", value=url)
-
-        # Extract and validate video ID
+        # Pattern validation; a matching URL always yields its video ID
         video_id = cls._extract_video_id(url)
         if not video_id:
-            raise ValidationError(
-                "Could not extract video ID from URL", field="url", value=url
-            )
+            raise ValidationError("Invalid YouTube URL format", field="url", value=url)
 
         # Return normalized URL
         return cls._normalize_url(video_id)
@@ -108,8 +153,9 @@ class URLValidator:
             raise ValidationError("URLs text cannot be empty")
 
         # Extract potential URLs
-        lines = urls_text.strip().split("\n")
+        lines = urls_text.splitlines()
         urls = []
+        seen = set()
 
         for line_num, line in enumerate(lines, 1):
             line = line.strip()
@@ -118,7 +164,6 @@ class URLValidator:
 
             try:
                 validated_url = cls.validate_youtube_url(line)
-                urls.append(validated_url)
             except (ValidationError, SecurityError) as e:
                 raise ValidationError(
                     f"Invalid URL on line {line_num}: {e.message}",
@@ -126,26 +171,27 @@ class URLValidator:
                     value=line,
                 )
 
+            # Stop at the first duplicate rather than validating the rest
+            if validated_url in seen:
+                raise ValidationError(
+                    f"Duplicate URL on line {line_num}",
+                    field="playlist_urls",
+                    value=line,
+                )
+            seen.add(validated_url)
+            urls.append(validated_url)
+
         if not urls:
             raise ValidationError("No valid URLs found in input")
 
-        # Check for duplicates
-        unique_urls = list(dict.fromkeys(urls))  # Preserve order
-        if len(unique_urls) != len(urls):
-            duplicates = len(urls) - len(unique_urls)
-            raise ValidationError(f"Found {duplicates} duplicate URL(s)")
-
-        return unique_urls
+        return urls
 
     @classmethod
-    def _check_security_issues(
-        cls, parsed_url: urllib.parse.ParseResult, original_url: str
-    ):
-        """Check for potential security issues in URL."""
+    def _check_raw_security_issues(cls, original_url: str):
+        """Check for potential security issues in the unparsed URL."""
 
         # Check for suspicious characters
-        suspicious_chars = ["<", ">", '"', "'", "&lt;", "&gt;", "&quot;"]
-        if any(char in original_url for char in suspicious_chars):
+        if _SUSPICIOUS_RE.search(original_url):
             raise SecurityError(
                 "URL contains suspicious characters", security_issue="potential_xss"
             )
@@ -154,32 +200,30 @@ class URLValidator:
         if len(original_url) > 2048:
             raise SecurityError("URL is too long", security_issue="potential_dos")
 
-        # Check for suspicious query parameters
-        if parsed_url.query:
+    @classmethod
+    def _check_security_issues(cls, parsed_url: urllib.parse.SplitResult):
+        """Check for potential security issues in the parsed URL."""
+
+        # _check_raw_security_issues() already scanned the raw query and
+        # fragment; only percent-escapes can hide suspicious characters from
+        # it, so decode the query parameters just when it contains any
+        if "%" in parsed_url.query:
             query_params = urllib.parse.parse_qs(parsed_url.query)
             for param, values in query_params.items():
                 for value in values:
-                    if any(char in value for char in suspicious_chars):
+                    if _SUSPICIOUS_RE.search(value):
                         raise SecurityError(
                             f"Suspicious content in URL parameter: {param}",
                             security_issue="potential_xss",
                         )
 
-        # Check for suspicious fragments
-        if parsed_url.fragment and any(
-            char in parsed_url.fragment for char in suspicious_chars
-        ):
-            raise SecurityError(
-                "Suspicious content in URL fragment", security_issue="potential_xss"
-            )
-
     @classmethod
     def _extract_video_id(cls, url: str) -> Optional[str]:
         """Extract video ID from YouTube URL."""
-        for pattern in cls.YOUTUBE_PATTERNS:
-            match = re.match(pattern, url, re.IGNORECASE)
-            if match:
-                return match.group(2)  # Video ID is always in group 2
+        match = cls.YOUTUBE_URL_RE.match(url)
+        if match:
+            # Only the matching branch's group is set
+            return match.group(match.lastindex)
         return None
 
     @classmethod
@@ -226,8 +270,7 @@ class NetworkValidator:
             )
 
         # Check for commonly dangerous ports
-        dangerous_ports = {22, 23, 25, 53, 80, 110, 143, 443, 993, 995}
-        if port in dangerous_ports:
+        if port in _DANGEROUS_PORTS:
             raise SecurityError(
                 f"Port {port} is commonly used by system services",
                 security_issue="dangerous_port",
@@ -321,42 +364,17 @@ class InputValidator:
             )
 
         # Check for dangerous characters
-        dangerous_chars = ["<", ">", ":", '"', "|", "?", "*", "\\", "/"]
-        if any(char in filename for char in dangerous_chars):
+        if _INVALID_FILENAME_RE.search(filename):
+            invalid = ", ".join(c for c in _INVALID_FILENAME_CHARS if c in filename)
             raise ValidationError(
-                f"Filename contains invalid characters: {', '.join(c for c in dangerous_chars if c in filename)}",
+                f"Filename contains invalid characters: {invalid}",
                 field="filename",
                 value=filename,
             )
 
         # Check for reserved names on Windows
-        reserved_names = {
-            "CON",
-            "PRN",
-            "AUX",
-            "NUL",
-            "COM1",
-            "COM2",
-            "COM3",
-            "COM4",
-            "COM5",
-            "COM6",
-            "COM7",
-            "COM8",
-            "COM9",
-            "LPT1",
-            "LPT2",
-            "LPT3",
-            "LPT4",
-            "LPT5",
-            "LPT6",
-            "LPT7",
-            "LPT8",
-            "LPT9",
-        }
-
-        base_name = filename.split(".")[0].upper()
-        if base_name in reserved_names:
+        base_name = filename.partition(".")[0].upper()
+        if base_name in _RESERVED_FILENAMES:
             raise ValidationError(
                 f"'{base_name}' is a reserved filename",
                 field="filename",
@@ -395,7 +413,7 @@ class InputValidator:
             )
 
         # Basic sanitization - remove potential script tags
-        if "<script" in query.lower() or "javascript:" in query.lower():
+        if _QUERY_SCRIPT_RE.search(query):
             raise SecurityError(
                 "Search query contains potentially malicious content",
                 security_issue="script_injection",
@@ -404,6 +422,17 @@ class InputValidator:
         return query
 
 
+# Validator for each input type accepted by validate_user_input()
+_VALIDATORS = {
+    "youtube_url": URLValidator.validate_youtube_url,
+    "playlist_urls": URLValidator.validate_playlist_urls,
+    "port": NetworkValidator.validate_port,
+    "ip_address": NetworkValidator.validate_ip_address,
+    "filename": InputValidator.validate_filename,
+    "search_query": InputValidator.validate_search_query,
+}
+
+
 def validate_user_input(input_type: str, value, **kwargs):
     """
     General purpose input validation dispatcher.
@@ -420,16 +449,8 @@ def validate_user_input(input_type: str, value, **kwargs):
         ValidationError: If validation fails
         SecurityError: If security checks fail
     """
-    validators = {
-        "youtube_url": URLValidator.validate_youtube_url,
-        "playlist_urls": URLValidator.validate_playlist_urls,
-        "port": NetworkValidator.validate_port,
-        "ip_address": NetworkValidator.validate_ip_address,
-        "filename": InputValidator.validate_filename,
-        "search_query": InputValidator.validate_search_query,
-    }
-
-    if input_type not in validators:
+    validator = _VALIDATORS.get(input_type)
+    if validator is None:
         raise ValidationError(f"Unknown input type: {input_type}")
 
-    return validators[input_type](value, **kwargs)
+    return validator(value, **kwargs)
@@ -22,6 +22,27 @@ def setup_environment() -> None:
         print("Debug mode enabled via environment variable")
 
 
+def validate_url(url: str) -> int:
+    """
+    Validate a YouTube URL and print the result, without starting the GUI.
+
+    Args:
+        url: URL to validate
+
+    Returns:
+        Exit code
+    """
+    from VLCYT.exceptions import SecurityError, ValidationError
+    from VLCYT.validators import URLValidator
+
+    try:
+        print(URLValidator.validate_youtube_url(url))
+    except (ValidationError, SecurityError) as e:
+        print(f"Invalid URL: {e.message}")
+        return 1
+    return 0
+
+
 def main(args: Optional[List[str]] = None) -> int:
     """
     Main entry point for the application.
@@ -35,6 +56,24 @@ def main(args: Optional[List[str]] = None) -> int:
     # Set up environment
     setup_environment()
 
+    # Parse command line arguments
+    if args is None:
+        args = sys.argv[1:]
+
+    # Answer command line only requests before paying for the PySide6 import
+    if args and args[0] in ("-h", "--help"):
+        print("Usage: main.py [URL]")
+        print("       main.py --validate URL")
+        print("       main.py --version")
+        return 0
+    if args and args[0] == "--version":
+        from VLCYT import __version__
+
+        print(f"VLCYT {__version__}")
+        return 0
+    if args and args[0] == "--validate":
+        return validate_url(args[1] if len(args) > 1 else "")
+
     # Import Qt components
     try:
         from PySide6.QtCore import Qt
@@ -54,10 +93,6 @@ def main(args: Optional[List[str]] = None) -> int:
     # Log startup
     logger.info("Starting VLCYT - Modern YouTube Player")
 
-    # Parse command line arguments
-    if args is None:
-        args = sys.argv[1:]
-
     # Set up Qt application
     app = QApplication(args)
     app.setApplicationName("Modern YouTube Player")
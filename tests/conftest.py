@@ -5,11 +5,43 @@ Pytest configuration and fixtures for VLCYT test suite.
 import pytest
 import sys
 import os
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# Bound before setup_test_environment swaps PySide6 out of sys.modules
+try:
+    from PySide6.QtWidgets import QApplication
+except ImportError:
+    QApplication = None
+
+
+def pytest_configure(config):
+    """Register markers and refuse to run with -O, which strips asserts."""
+    config.addinivalue_line("markers", "slow: tests that start real threads or do I/O")
+    config.addinivalue_line(
+        "markers", "integration: tests that wire several managers together"
+    )
+
+    if sys.flags.optimize:
+        pytest.exit("Tests must run without -O / PYTHONOPTIMIZE", returncode=4)
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Single QApplication shared by all widget tests, or None without Qt."""
+    if QApplication is None:
+        return None
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _mock_libvlc():
+    """Keep VLCPlayer off the native libVLC for the whole test session."""
+    with patch("VLCYT.core.vlc_player.vlc") as mock_vlc:
+        yield mock_vlc
+
 
 @pytest.fixture
 def mock_vlc():
@@ -73,11 +105,15 @@ def setup_test_environment():
     mock_vlc.MediaPlayer.return_value = MagicMock()
     sys.modules["vlc"] = mock_vlc
 
-    # Also mock PySide6 to avoid Qt initialization
-    mock_pyside6 = MagicMock()
-    sys.modules["PySide6"] = mock_pyside6
-    sys.modules["PySide6.QtWidgets"] = mock_pyside6
-    sys.modules["PySide6.QtCore"] = mock_pyside6
+    # Also mock PySide6 to avoid Qt initialization. A real PySide6 that is
+    # already loaded stays in place: shiboken resolves Qt types through
+    # sys.modules, and a mock there crashes the interpreter in real widgets
+    qt_modules = ["PySide6", "PySide6.QtWidgets", "PySide6.QtCore"]
+    real_qt = QApplication is not None
+    if not real_qt:
+        mock_pyside6 = MagicMock()
+        for module in qt_modules:
+            sys.modules[module] = mock_pyside6
 
     try:
         yield
@@ -85,6 +121,7 @@ def setup_test_environment():
         # Clean up mocks
         if "vlc" in sys.modules:
             del sys.modules["vlc"]
-        for module in ["PySide6", "PySide6.QtWidgets", "PySide6.QtCore"]:
-            if module in sys.modules:
-                del sys.modules[module]
+        if not real_qt:
+            for module in qt_modules:
+                if module in sys.modules:
+                    del sys.modules[module]
@@ -12,6 +12,27 @@ from VLCYT.exceptions import (
     TranscriptError,
 )
 
+# Each exception class with a full set of its context arguments
+_EXCEPTION_REGISTRY = [
+    (NetworkError, {"url": "https://example.com", "status_code": 500}),
+    (VideoExtractionError, {"video_url": "https://youtu.be/x", "reason": "private"}),
+    (VLCError, {"operation": "play"}),
+    (ValidationError, {"field": "port", "value": 70000}),
+    (SecurityError, {"security_issue": "potential_xss"}),
+    (ThreadError, {"thread_id": "worker_1", "thread_type": "video_fetch"}),
+    (TranscriptError, {"video_id": "dQw4w9WgXcQ", "reason": "disabled"}),
+]
+
+
+@pytest.fixture(
+    scope="session",
+    params=_EXCEPTION_REGISTRY,
+    ids=[exc_cls.__name__ for exc_cls, _ in _EXCEPTION_REGISTRY],
+)
+def exception_entry(request):
+    """An (exception class, context kwargs) pair, once per exception class."""
+    return request.param
+
 
 class TestVLCYTError:
     """Tests for base VLCYTError exception."""
@@ -57,78 +78,77 @@ class TestVLCYTError:
 class TestNetworkError:
     """Tests for NetworkError exception."""
 
-    def test_basic_network_error(self):
-        """Test basic network error."""
-        error = NetworkError("Connection failed")
-
-        assert "Network error: Connection failed" in error.user_message
-        assert error.url is None
-        assert error.status_code is None
-
-    def test_network_error_with_url(self):
-        """Test network error with URL."""
-        error = NetworkError("Request failed", url="https://example.com")
-
-        assert error.url == "https://example.com"
-        assert "Network error: Request failed" in error.user_message
-
-    def test_network_error_with_status_code(self):
-        """Test network error with HTTP status code."""
-        error = NetworkError("Not found", status_code=404)
-
-        assert error.status_code == 404
-        assert "HTTP 404" in error.user_message
-        assert "Network error: Not found" in error.user_message
-
-    def test_network_error_with_all_parameters(self):
-        """Test network error with all parameters."""
-        error = NetworkError(
-            "Server error", url="https://api.example.com", status_code=500
-        )
-
-        assert error.url == "https://api.example.com"
-        assert error.status_code == 500
-        assert "Network error: Server error (HTTP 500)" == error.user_message
+    @pytest.mark.parametrize(
+        "message,url,status_code,expected",
+        [
+            pytest.param(
+                "Connection failed",
+                None,
+                None,
+                "Network error: Connection failed",
+                id="basic",
+            ),
+            pytest.param(
+                "Request failed",
+                "https://example.com",
+                None,
+                "Network error: Request failed",
+                id="url",
+            ),
+            pytest.param(
+                "Not found",
+                None,
+                404,
+                "Network error: Not found (HTTP 404)",
+                id="status_code",
+            ),
+            pytest.param(
+                "Server error",
+                "https://api.example.com",
+                500,
+                "Network error: Server error (HTTP 500)",
+                id="all",
+            ),
+        ],
+    )
+    def test_network_error(self, message, url, status_code, expected):
+        """Test network error attributes and user message."""
+        error = NetworkError(message, url=url, status_code=status_code)
+
+        assert error.url == url
+        assert error.status_code == status_code
+        assert error.user_message == expected
 
 
 class TestVideoExtractionError:
     """Tests for VideoExtractionError exception."""
 
-    def test_basic_video_extraction_error(self):
-        """Test basic video extraction error."""
-        error = VideoExtractionError("Failed to extract video")
-
-        assert error.message == "Failed to extract video"
-        assert error.video_url is None
-        assert error.reason is None
-
-    def test_video_extraction_error_with_url(self):
-        """Test video extraction error with URL."""
-        error = VideoExtractionError(
-            "Extraction failed", video_url="https://youtube.com/watch?v=test"
-        )
-
-        assert error.video_url == "https://youtube.com/watch?v=test"
-        assert error.message == "Extraction failed"
-
-    def test_video_extraction_error_with_reason(self):
-        """Test video extraction error with reason."""
-        error = VideoExtractionError("Extraction failed", reason="Video is private")
-
-        assert error.reason == "Video is private"
-        assert error.message == "Extraction failed"
-
-    def test_video_extraction_error_all_parameters(self):
-        """Test video extraction error with all parameters."""
-        error = VideoExtractionError(
-            "Cannot extract video",
-            video_url="https://youtube.com/watch?v=private",
-            reason="Access denied",
-        )
-
-        assert error.message == "Cannot extract video"
-        assert error.video_url == "https://youtube.com/watch?v=private"
-        assert error.reason == "Access denied"
+    @pytest.mark.parametrize(
+        "message,video_url,reason",
+        [
+            pytest.param("Failed to extract video", None, None, id="basic"),
+            pytest.param(
+                "Extraction failed",
+                "https://youtube.com/watch?v=test",
+                None,
+                id="url",
+            ),
+            pytest.param("Extraction failed", None, "Video is private", id="reason"),
+            pytest.param(
+                "Cannot extract video",
+                "https://youtube.com/watch?v=private",
+                "Access denied",
+                id="all",
+            ),
+        ],
+    )
+    def test_video_extraction_error(self, message, video_url, reason):
+        """Test video extraction error attributes."""
+        error = VideoExtractionError(message, video_url=video_url, reason=reason)
+
+        assert error.message == message
+        assert error.video_url == video_url
+        assert error.reason == reason
 
 
 class TestVLCError:
@@ -159,35 +179,22 @@ class TestVLCError:
 class TestValidationError:
     """Tests for ValidationError exception."""
 
-    def test_basic_validation_error(self):
-        """Test basic validation error."""
-        error = ValidationError("Invalid input")
-
-        assert error.message == "Invalid input"
-        assert error.field is None
-        assert error.value is None
-
-    def test_validation_error_with_field(self):
-        """Test validation error with field name."""
-        error = ValidationError("Invalid URL", field="url")
+    @pytest.mark.parametrize(
+        "message,field,value",
+        [
+            pytest.param("Invalid input", None, None, id="basic"),
+            pytest.param("Invalid URL", "url", None, id="field"),
+            pytest.param("Invalid port", None, 99999, id="value"),
+            pytest.param("Port out of range", "port", 70000, id="all"),
+        ],
+    )
+    def test_validation_error(self, message, field, value):
+        """Test validation error attributes."""
+        error = ValidationError(message, field=field, value=value)
 
-        assert error.field == "url"
-        assert error.message == "Invalid URL"
-
-    def test_validation_error_with_value(self):
-        """Test validation error with invalid value."""
-        error = ValidationError("Invalid port", value=99999)
-
-        assert error.value == 99999
-        assert error.message == "Invalid port"
-
-    def test_validation_error_all_parameters(self):
-        """Test validation error with all parameters."""
-        error = ValidationError("Port out of range", field="port", value=70000)
-
-        assert error.message == "Port out of range"
-        assert error.field == "port"
-        assert error.value == 70000
+        assert error.message == message
+        assert error.field == field
+        assert error.value == value
 
 
 class TestSecurityError:
@@ -211,95 +218,63 @@ class TestSecurityError:
 class TestThreadError:
     """Tests for ThreadError exception."""
 
-    def test_basic_thread_error(self):
-        """Test basic thread error."""
-        error = ThreadError("Thread execution failed")
-
-        assert error.message == "Thread execution failed"
-        assert error.thread_id is None
-        assert error.thread_type is None
-
-    def test_thread_error_with_thread_id(self):
-        """Test thread error with thread ID."""
-        error = ThreadError("Thread timeout", thread_id="worker_1")
-
-        assert error.thread_id == "worker_1"
-        assert error.message == "Thread timeout"
-
-    def test_thread_error_with_thread_type(self):
-        """Test thread error with thread type."""
-        error = ThreadError("Operation failed", thread_type="video_fetch")
-
-        assert error.thread_type == "video_fetch"
-        assert error.message == "Operation failed"
-
-    def test_thread_error_all_parameters(self):
-        """Test thread error with all parameters."""
-        error = ThreadError(
-            "Thread crashed", thread_id="bg_worker_2", thread_type="transcript_fetch"
-        )
+    @pytest.mark.parametrize(
+        "message,thread_id,thread_type",
+        [
+            pytest.param("Thread execution failed", None, None, id="basic"),
+            pytest.param("Thread timeout", "worker_1", None, id="thread_id"),
+            pytest.param("Operation failed", None, "video_fetch", id="thread_type"),
+            pytest.param("Thread crashed", "bg_worker_2", "transcript_fetch", id="all"),
+        ],
+    )
+    def test_thread_error(self, message, thread_id, thread_type):
+        """Test thread error attributes."""
+        error = ThreadError(message, thread_id=thread_id, thread_type=thread_type)
 
-        assert error.message == "Thread crashed"
-        assert error.thread_id == "bg_worker_2"
-        assert error.thread_type == "transcript_fetch"
+        assert error.message == message
+        assert error.thread_id == thread_id
+        assert error.thread_type == thread_type
 
 
 class TestTranscriptError:
     """Tests for TranscriptError exception."""
 
-    def test_basic_transcript_error(self):
-        """Test basic transcript error."""
-        error = TranscriptError("Transcript not available")
-
-        assert error.message == "Transcript not available"
-        assert error.video_id is None
-        assert error.reason is None
-
-    def test_transcript_error_with_video_id(self):
-        """Test transcript error with video ID."""
-        error = TranscriptError("No captions found", video_id="dQw4w9WgXcQ")
-
-        assert error.video_id == "dQw4w9WgXcQ"
-        assert error.message == "No captions found"
-
-    def test_transcript_error_with_reason(self):
-        """Test transcript error with reason."""
-        error = TranscriptError("Language not supported", reason="es not available")
-
-        assert error.reason == "es not available"
-        assert error.message == "Language not supported"
-
-    def test_transcript_error_all_parameters(self):
-        """Test transcript error with all parameters."""
-        error = TranscriptError(
-            "Auto-generated captions disabled",
-            video_id="abc123",
-            reason="disabled by uploader",
-        )
-
-        assert error.message == "Auto-generated captions disabled"
-        assert error.video_id == "abc123"
-        assert error.reason == "disabled by uploader"
+    @pytest.mark.parametrize(
+        "message,video_id,reason",
+        [
+            pytest.param("Transcript not available", None, None, id="basic"),
+            pytest.param("No captions found", "dQw4w9WgXcQ", None, id="video_id"),
+            pytest.param(
+                "Language not supported", None, "es not available", id="reason"
+            ),
+            pytest.param(
+                "Auto-generated captions disabled",
+                "abc123",
+                "disabled by uploader",
+                id="all",
+            ),
+        ],
+    )
+    def test_transcript_error(self, message, video_id, reason):
+        """Test transcript error attributes."""
+        error = TranscriptError(message, video_id=video_id, reason=reason)
+
+        assert error.message == message
+        assert error.video_id == video_id
+        assert error.reason == reason
 
 
 class TestExceptionInheritance:
     """Tests for exception inheritance hierarchy."""
 
-    def test_all_exceptions_inherit_from_vlcyt_error(self):
-        """Test that all custom exceptions inherit from VLCYTError."""
-        exceptions = [
-            NetworkError("test"),
-            VideoExtractionError("test"),
-            VLCError("test"),
-            ValidationError("test"),
-            SecurityError("test"),
-            ThreadError("test"),
-            TranscriptError("test"),
-        ]
-
-        for exc in exceptions:
-            assert isinstance(exc, VLCYTError)
-            assert isinstance(exc, Exception)
+    def test_exception_keeps_context_attributes(self, exception_entry):
+        """Test every exception exposes the context it was created with."""
+        exc_cls, kwargs = exception_entry
+        exc = exc_cls("test", **kwargs)
+
+        assert exc.message == "test"
+        for name, value in kwargs.items():
+            assert getattr(exc, name) == value
 
     def test_exception_str_representation(self):
         """Test string representation of exceptions."""
@@ -309,11 +284,11 @@ class TestExceptionInheritance:
         network_error = NetworkError("Network issue")
         assert "Network issue" in str(network_error)
 
-    def test_exception_with_context(self):
-        """Test exceptions can be raised and caught properly."""
-        with pytest.raises(VLCYTError) as exc_info:
-            raise ValidationError("Test validation error")
+    def test_raises_as_vlcyt_error(self, exception_entry):
+        """Test every exception can be caught as VLCYTError."""
+        exc_cls, kwargs = exception_entry
+
+        with pytest.raises(VLCYTError, match="boom") as exc_info:
+            raise exc_cls("boom", **kwargs)
 
-        assert exc_info.value.message == "Test validation error"
-        assert isinstance(exc_info.value, ValidationError)
-        assert isinstance(exc_info.value, VLCYTError)
+        assert type(exc_info.value) is exc_cls
@@ -1,5 +1,7 @@
 """Extended tests for format utilities to improve coverage."""
 
+import pytest
+
 from VLCYT.utils.format_utils import (
     parse_playlist_urls,
     truncate_text,
@@ -12,245 +14,203 @@ from VLCYT.utils.format_utils import (
 class TestParsePlaylistUrls:
     """Tests for parse_playlist_urls function."""
 
-    def test_parse_single_youtube_url(self):
-        """Test parsing a single YouTube URL."""
-        text = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
-        result = parse_playlist_urls(text)
-        assert result == ["https://www.youtube.com/watch?v=dQw4w9WgXcQ"]
-
-    def test_parse_multiple_youtube_urls(self):
-        """Test parsing multiple YouTube URLs."""
-        text = """
-        https://www.youtube.com/watch?v=dQw4w9WgXcQ
-        https://youtu.be/abc123
-        https://youtube.com/shorts/xyz789
-        """
-        result = parse_playlist_urls(text)
-        assert len(result) == 3
-        assert "https://www.youtube.com/watch?v=dQw4w9WgXcQ" in result
-        assert "https://youtu.be/abc123" in result
-        assert "https://youtube.com/shorts/xyz789" in result
-
-    def test_parse_url_without_scheme(self):
-        """Test parsing URL without http/https scheme."""
-        text = "www.youtube.com/watch?v=dQw4w9WgXcQ"
-        result = parse_playlist_urls(text)
-        assert result == ["https://www.youtube.com/watch?v=dQw4w9WgXcQ"]
-
-    def test_parse_empty_lines(self):
-        """Test parsing text with empty lines."""
-        text = """
-        
-        https://www.youtube.com/watch?v=test1
-        
-        https://youtu.be/test2
-        
-        """
-        result = parse_playlist_urls(text)
-        assert len(result) == 2
-
-    def test_parse_non_youtube_urls(self):
-        """Test parsing non-YouTube URLs."""
-        text = """
-        https://example.com/video.mp4
-        http://another.com/stream
-        """
-        result = parse_playlist_urls(text)
-        assert len(result) == 2
-        assert "https://example.com/video.mp4" in result
-        assert "http://another.com/stream" in result
-
-    def test_parse_mixed_content(self):
-        """Test parsing mixed YouTube and other URLs."""
-        text = """
-        https://www.youtube.com/watch?v=yt123
-        https://example.com/video.mp4
-        some random text
-        youtu.be/yt456
-        """
-        result = parse_playlist_urls(text)
-        assert len(result) == 3
-        assert "https://www.youtube.com/watch?v=yt123" in result
-        assert "https://example.com/video.mp4" in result
-        assert "https://youtu.be/yt456" in result
-
-    def test_parse_empty_text(self):
-        """Test parsing empty text."""
-        result = parse_playlist_urls("")
-        assert result == []
-
-    def test_parse_playlist_url(self):
-        """Test parsing YouTube playlist URL."""
-        text = "https://www.youtube.com/playlist?list=PLtest123"
-        result = parse_playlist_urls(text)
-        assert result == ["https://www.youtube.com/playlist?list=PLtest123"]
+    @pytest.mark.parametrize(
+        "text,expected",
+        [
+            pytest.param(
+                "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+                ["https://www.youtube.com/watch?v=dQw4w9WgXcQ"],
+                id="single",
+            ),
+            pytest.param(
+                """
+                https://www.youtube.com/watch?v=dQw4w9WgXcQ
+                https://youtu.be/abc123
+                https://youtube.com/shorts/xyz789
+                """,
+                [
+                    "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+                    "https://youtu.be/abc123",
+                    "https://youtube.com/shorts/xyz789",
+                ],
+                id="multiple",
+            ),
+            pytest.param(
+                "www.youtube.com/watch?v=dQw4w9WgXcQ",
+                ["https://www.youtube.com/watch?v=dQw4w9WgXcQ"],
+                id="no_scheme",
+            ),
+            pytest.param(
+                """
+
+                https://www.youtube.com/watch?v=test1
+
+                https://youtu.be/test2
+
+                """,
+                ["https://www.youtube.com/watch?v=test1", "https://youtu.be/test2"],
+                id="empty_lines",
+            ),
+            pytest.param(
+                """
+                https://example.com/video.mp4
+                http://another.com/stream
+                """,
+                ["https://example.com/video.mp4", "http://another.com/stream"],
+                id="non_youtube",
+            ),
+            pytest.param(
+                """
+                https://www.youtube.com/watch?v=yt123
+                https://example.com/video.mp4
+                some random text
+                youtu.be/yt456
+                """,
+                [
+                    "https://www.youtube.com/watch?v=yt123",
+                    "https://example.com/video.mp4",
+                    "https://youtu.be/yt456",
+                ],
+                id="mixed",
+            ),
+            pytest.param("", [], id="empty"),
+            pytest.param(
+                "https://www.youtube.com/playlist?list=PLtest123",
+                ["https://www.youtube.com/playlist?list=PLtest123"],
+                id="playlist",
+            ),
+        ],
+    )
+    def test_parse_playlist_urls(self, text, expected):
+        """Test URLs are extracted from pasted text in input order."""
+        assert parse_playlist_urls(text) == expected
 
 
 class TestTruncateText:
     """Tests for truncate_text function."""
 
-    def test_truncate_short_text(self):
-        """Test truncating text shorter than max length."""
-        result = truncate_text("Hello", 10)
-        assert result == "Hello"
-
-    def test_truncate_exact_length(self):
-        """Test truncating text at exact max length."""
-        result = truncate_text("Hello", 5)
-        assert result == "Hello"
-
-    def test_truncate_long_text(self):
-        """Test truncating text longer than max length."""
-        result = truncate_text("This is a very long text", 10)
-        assert result == "This is..."
-        assert len(result) == 10
+    @pytest.mark.parametrize(
+        "text,max_length,expected",
+        [
+            pytest.param("Hello", 10, "Hello", id="short"),
+            pytest.param("Hello", 5, "Hello", id="exact_length"),
+            pytest.param("This is a very long text", 10, "This is a\u2026", id="long"),
+            pytest.param("", 10, "", id="empty"),
+        ],
+    )
+    def test_truncate_text(self, text, max_length, expected):
+        """Test text is cut to max_length, ending in an ellipsis if cut."""
+        result = truncate_text(text, max_length)
+        assert result == expected
+        assert len(result) <= max_length
 
     def test_truncate_with_default_length(self):
         """Test truncating with default max length."""
-        long_text = "a" * 60
-        result = truncate_text(long_text)
-        assert len(result) == 50
-        assert result.endswith("...")
-
-    def test_truncate_empty_string(self):
-        """Test truncating empty string."""
-        result = truncate_text("", 10)
-        assert result == ""
+        result = truncate_text("a" * 60)
+        assert result == "a" * 49 + "\u2026"
 
 
 class TestExtractVideoId:
     """Tests for extract_video_id function."""
 
-    def test_extract_from_standard_url(self):
-        """Test extracting video ID from standard YouTube URL."""
-        url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
-        result = extract_video_id(url)
-        assert result == "dQw4w9WgXcQ"
-
-    def test_extract_from_short_url(self):
-        """Test extracting video ID from short YouTube URL."""
-        url = "https://youtu.be/dQw4w9WgXcQ"
-        result = extract_video_id(url)
-        assert result == "dQw4w9WgXcQ"
-
-    def test_extract_from_shorts_url(self):
-        """Test extracting video ID from YouTube Shorts URL."""
-        url = "https://www.youtube.com/shorts/dQw4w9WgXcQ"
-        result = extract_video_id(url)
-        assert result == "dQw4w9WgXcQ"
-
-    def test_extract_from_url_without_scheme(self):
-        """Test extracting video ID from URL without scheme."""
-        url = "www.youtube.com/watch?v=dQw4w9WgXcQ"
-        result = extract_video_id(url)
-        assert result == "dQw4w9WgXcQ"
-
-    def test_extract_from_url_with_additional_params(self):
-        """Test extracting video ID from URL with additional parameters."""
-        url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=30s&list=PLtest"
-        result = extract_video_id(url)
-        assert result == "dQw4w9WgXcQ"
-
-    def test_extract_from_invalid_url(self):
-        """Test extracting video ID from invalid URL."""
-        url = "https://example.com/not-youtube"
-        result = extract_video_id(url)
-        assert result is None
-
-    def test_extract_from_empty_url(self):
-        """Test extracting video ID from empty URL."""
-        result = extract_video_id("")
-        assert result is None
+    @pytest.mark.parametrize(
+        "url,expected",
+        [
+            pytest.param(
+                "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+                "dQw4w9WgXcQ",
+                id="standard",
+            ),
+            pytest.param("https://youtu.be/dQw4w9WgXcQ", "dQw4w9WgXcQ", id="short"),
+            pytest.param(
+                "https://www.youtube.com/shorts/dQw4w9WgXcQ",
+                "dQw4w9WgXcQ",
+                id="shorts",
+            ),
+            pytest.param(
+                "www.youtube.com/watch?v=dQw4w9WgXcQ", "dQw4w9WgXcQ", id="no_scheme"
+            ),
+            pytest.param(
+                "https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=30s&list=PLtest",
+                "dQw4w9WgXcQ",
+                id="additional_params",
+            ),
+            pytest.param("https://example.com/not-youtube", None, id="invalid"),
+            pytest.param("", None, id="empty"),
+        ],
+    )
+    def test_extract_video_id(self, url, expected):
+        """Test video IDs are extracted from each supported URL form."""
+        assert extract_video_id(url) == expected
 
 
 class TestExtractPlaylistId:
     """Tests for extract_playlist_id function."""
 
-    def test_extract_from_playlist_url(self):
-        """Test extracting playlist ID from YouTube playlist URL."""
-        url = "https://www.youtube.com/playlist?list=PLrAXtmRdnEQy4Q1rQZGzCc5Q1rQz5Q"
-        result = extract_playlist_id(url)
-        assert result == "PLrAXtmRdnEQy4Q1rQZGzCc5Q1rQz5Q"
-
-    def test_extract_from_playlist_url_without_scheme(self):
-        """Test extracting playlist ID from URL without scheme."""
-        url = "www.youtube.com/playlist?list=PLtest123"
-        result = extract_playlist_id(url)
-        assert result == "PLtest123"
-
-    def test_extract_from_playlist_url_with_additional_params(self):
-        """Test extracting playlist ID from URL with additional parameters."""
-        url = "https://www.youtube.com/playlist?list=PLtest123&index=5&t=30s"
-        result = extract_playlist_id(url)
-        assert result == "PLtest123"
-
-    def test_extract_from_non_playlist_url(self):
-        """Test extracting playlist ID from non-playlist URL."""
-        url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
-        result = extract_playlist_id(url)
-        assert result is None
-
-    def test_extract_from_invalid_url(self):
-        """Test extracting playlist ID from invalid URL."""
-        url = "https://example.com/not-youtube"
-        result = extract_playlist_id(url)
-        assert result is None
-
-    def test_extract_from_empty_url(self):
-        """Test extracting playlist ID from empty URL."""
-        result = extract_playlist_id("")
-        assert result is None
+    @pytest.mark.parametrize(
+        "url,expected",
+        [
+            pytest.param(
+                "https://www.youtube.com/playlist?list=PLrAXtmRdnEQy4Q1rQZGzCc5Q1rQz5Q",
+                "PLrAXtmRdnEQy4Q1rQZGzCc5Q1rQz5Q",
+                id="playlist",
+            ),
+            pytest.param(
+                "www.youtube.com/playlist?list=PLtest123", "PLtest123", id="no_scheme"
+            ),
+            pytest.param(
+                "https://www.youtube.com/playlist?list=PLtest123&index=5&t=30s",
+                "PLtest123",
+                id="additional_params",
+            ),
+            pytest.param(
+                "https://www.youtube.com/watch?v=dQw4w9WgXcQ", None, id="non_playlist"
+            ),
+            pytest.param("https://example.com/not-youtube", None, id="invalid"),
+            pytest.param("", None, id="empty"),
+        ],
+    )
+    def test_extract_playlist_id(self, url, expected):
+        """Test playlist IDs are extracted only from playlist URLs."""
+        assert extract_playlist_id(url) == expected
 
 
 class TestFormatYoutubeTitle:
     """Tests for format_youtube_title function."""
 
-    def test_format_title_with_youtube_suffix(self):
-        """Test formatting title with YouTube suffix."""
-        title = "Amazing Video - YouTube"
-        result = format_youtube_title(title)
-        assert result == "Amazing Video"
-
-    def test_format_title_with_spaced_youtube_suffix(self):
-        """Test formatting title with spaced YouTube suffix."""
-        title = "Great Content  -  YouTube  "
-        result = format_youtube_title(title)
-        assert result == "Great Content"
-
-    def test_format_title_without_youtube_suffix(self):
-        """Test formatting title without YouTube suffix."""
-        title = "Normal Video Title"
-        result = format_youtube_title(title)
-        assert result == "Normal Video Title"
-
-    def test_format_title_with_html_entities(self):
-        """Test formatting title with HTML entities."""
-        title = (
-            "Video &amp; More &lt;Content&gt; &quot;Quotes&quot; &#39;Apostrophe&#39;"
-        )
-        result = format_youtube_title(title)
-        expected = "Video & More <Content> \"Quotes\" 'Apostrophe'"
-        assert result == expected
-
-    def test_format_title_with_html_entities_and_youtube_suffix(self):
-        """Test formatting title with both HTML entities and YouTube suffix."""
-        title = "Test &amp; Video - YouTube"
-        result = format_youtube_title(title)
-        assert result == "Test & Video"
-
-    def test_format_empty_title(self):
-        """Test formatting empty title."""
-        result = format_youtube_title("")
-        assert result == ""
-
-    def test_format_title_with_only_whitespace(self):
-        """Test formatting title with only whitespace."""
-        title = "   \t\n   "
-        result = format_youtube_title(title)
-        assert result == ""
-
-    def test_format_title_complex_case(self):
-        """Test formatting complex title case."""
-        title = "  Complex &amp; Video &lt;Title&gt; - YouTube  "
-        result = format_youtube_title(title)
-        assert result == "Complex & Video <Title>"
+    @pytest.mark.parametrize(
+        "title,expected",
+        [
+            pytest.param("Amazing Video - YouTube", "Amazing Video", id="suffix"),
+            pytest.param(
+                "Great Content  -  YouTube  ", "Great Content", id="spaced_suffix"
+            ),
+            pytest.param("Normal Video Title", "Normal Video Title", id="no_suffix"),
+            pytest.param(
+                "Video &amp; More &lt;Content&gt; &quot;Quotes&quot; "
+                "&#39;Apostrophe&#39;",
+                "Video & More <Content> \"Quotes\" 'Apostrophe'",
+                id="html_entities",
+            ),
+            pytest.param(
+                "Use &amp;lt;b&amp;gt; tags",
+                "Use &lt;b&gt; tags",
+                id="entities_decoded_once",
+            ),
+            pytest.param(
+                "Test &amp; Video - YouTube",
+                "Test & Video",
+                id="entities_and_suffix",
+            ),
+            pytest.param("", "", id="empty"),
+            pytest.param("   \t\n   ", "", id="whitespace_only"),
+            pytest.param(
+                "  Complex &amp; Video &lt;Title&gt; - YouTube  ",
+                "Complex & Video <Title>",
+                id="complex",
+            ),
+        ],
+    )
+    def test_format_youtube_title(self, title, expected):
+        """Test titles lose the YouTube suffix and have entities decoded."""
+        assert format_youtube_title(title) == expected
@@ -1,9 +1,45 @@
 """Tests for VLCYT managers."""
 
+import threading
+
+import pytest
+
 from VLCYT.managers.thread_manager import ThreadManager
 from VLCYT.managers.settings_manager import SettingsManager
 
 
+class FakeQSettings:
+    """In-memory QSettings double, so tests never touch the Qt settings file."""
+
+    def __init__(self):
+        self._store = {}
+
+    def contains(self, key):
+        return key in self._store
+
+    def value(self, key, default=None, type=None):
+        value = self._store.get(key, default)
+        return type(value) if type is not None and value is not None else value
+
+    def setValue(self, key, value):
+        self._store[key] = value
+
+    def sync(self):
+        pass
+
+
+@pytest.fixture
+def fake_qsettings():
+    """Empty in-memory settings store."""
+    return FakeQSettings()
+
+
+@pytest.fixture
+def settings_manager(fake_qsettings):
+    """SettingsManager backed by an in-memory settings store."""
+    return SettingsManager(fake_qsettings)
+
+
 class TestThreadManager:
     """Tests for ThreadManager."""
 
@@ -13,6 +49,7 @@ class TestThreadManager:
         assert manager._max_threads == 3
         assert len(manager._active_threads) == 0
 
+    @pytest.mark.slow
     def test_submit_task(self):
         """Test submitting a task."""
         manager = ThreadManager(max_threads=2)
@@ -25,18 +62,21 @@ class TestThreadManager:
         assert thread is not None
         assert thread in manager._active_threads
 
+    @pytest.mark.slow
     def test_cancel_all_threads(self):
         """Test canceling all threads."""
         manager = ThreadManager(max_threads=2)
+        started = threading.Event()
+        release = threading.Event()
 
         def test_func():
-            import time
-
-            time.sleep(1)
+            started.set()
+            release.wait(timeout=5)
             return "test"
 
-        # Submit a task
+        # Submit a task and wait until it is running
         thread = manager.submit(test_func)
+        assert started.wait(timeout=1)
 
         # Cancel all threads
         manager.cancel_all_threads()
@@ -44,6 +84,10 @@ class TestThreadManager:
         # Verify thread was canceled
         assert thread.is_canceled()
 
+        release.set()
+        thread.join(timeout=1)
+
+    @pytest.mark.slow
     def test_shutdown(self):
         """Test manager shutdown."""
         manager = ThreadManager(max_threads=2)
@@ -64,34 +108,21 @@ class TestThreadManager:
 class TestSettingsManager:
     """Tests for SettingsManager."""
 
-    def test_settings_manager_initialization(self):
+    def test_settings_manager_initialization(self, fake_qsettings):
         """Test SettingsManager initialization."""
-        from VLCYT.managers.settings_manager import QSettings
+        manager = SettingsManager(fake_qsettings)
+        assert manager.qsettings is fake_qsettings
 
-        mock_settings = QSettings("Test", "TestApp")
-        manager = SettingsManager(mock_settings)
-        assert manager.qsettings == mock_settings
-
-    def test_volume_settings(self):
+    def test_volume_settings(self, settings_manager):
         """Test volume settings."""
-        from VLCYT.managers.settings_manager import QSettings
-
-        mock_settings = QSettings("Test", "TestApp")
-        manager = SettingsManager(mock_settings)
-
         # Test setting and getting volume
-        manager.set_volume(75)
-        volume = manager.get_volume()
+        settings_manager.set_volume(75)
+        volume = settings_manager.get_volume()
         assert volume == 75
 
-    def test_quality_settings(self):
+    def test_quality_settings(self, settings_manager):
         """Test quality settings."""
-        from VLCYT.managers.settings_manager import QSettings
-
-        mock_settings = QSettings("Test", "TestApp")
-        manager = SettingsManager(mock_settings)
-
         # Test setting and getting quality
-        manager.set_default_quality("720p")
-        quality = manager.get_default_quality()
+        settings_manager.set_default_quality("720p")
+        quality = settings_manager.get_default_quality()
         assert quality == "720p"
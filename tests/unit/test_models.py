@@ -1,48 +1,67 @@
 """Tests for VLCYT models."""
 
+import pytest
+
 from VLCYT.models import PlaylistItem
 
+_ITEM = dict(url="https://youtube.com/watch?v=test", title="Test Video", duration=300)
+
+
+@pytest.fixture
+def make_item():
+    """Factory for PlaylistItems based on _ITEM, with field overrides."""
+
+    def _make(**overrides):
+        return PlaylistItem(**{**_ITEM, **overrides})
+
+    return _make
+
 
 class TestPlaylistItem:
     """Tests for PlaylistItem model."""
 
-    def test_playlist_item_creation(self):
+    def test_playlist_item_creation(self, make_item):
         """Test creating a PlaylistItem."""
-        item = PlaylistItem(
-            url="https://youtube.com/watch?v=test",
-            title="Test Video",
-            duration=300,
-            thumbnail="test_thumb.jpg",
-        )
+        item = make_item(thumbnail="test_thumb.jpg")
 
         assert item.url == "https://youtube.com/watch?v=test"
         assert item.title == "Test Video"
         assert item.duration == 300
         assert item.thumbnail == "test_thumb.jpg"
 
-    def test_playlist_item_equality(self):
+    @pytest.mark.parametrize(
+        "lhs,rhs,equal",
+        [
+            pytest.param(_ITEM, dict(_ITEM), True, id="identical"),
+            pytest.param(
+                _ITEM,
+                {**_ITEM, "url": "https://youtube.com/watch?v=different"},
+                False,
+                id="different_url",
+            ),
+            pytest.param(
+                _ITEM,
+                {**_ITEM, "title": "Different Video"},
+                False,
+                id="different_title",
+            ),
+            pytest.param(
+                _ITEM, {**_ITEM, "duration": 999}, False, id="different_duration"
+            ),
+            pytest.param(
+                _ITEM,
+                {**_ITEM, "thumbnail": "thumb.jpg"},
+                False,
+                id="different_thumbnail",
+            ),
+        ],
+    )
+    def test_playlist_item_equality(self, lhs, rhs, equal):
         """Test PlaylistItem equality comparison."""
-        item1 = PlaylistItem(
-            url="https://youtube.com/watch?v=test", title="Test Video", duration=300
-        )
-        item2 = PlaylistItem(
-            url="https://youtube.com/watch?v=test", title="Test Video", duration=300
-        )
-        item3 = PlaylistItem(
-            url="https://youtube.com/watch?v=different",
-            title="Different Video",
-            duration=200,
-        )
-
-        assert item1 == item2
-        assert item1 != item3
-
-    def test_playlist_item_repr(self):
-        """Test PlaylistItem string representation."""
-        item = PlaylistItem(
-            url="https://youtube.com/watch?v=test", title="Test Video", duration=300
-        )
+        assert (PlaylistItem(**lhs) == PlaylistItem(**rhs)) is equal
 
-        repr_str = repr(item)
+    def test_playlist_item_repr(self, make_item):
+        """Test PlaylistItem string representation."""
+        repr_str = repr(make_item())
         assert "PlaylistItem" in repr_str
         assert "Test Video" in repr_str
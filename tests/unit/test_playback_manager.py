@@ -1,177 +1,212 @@
 """Tests for Playback Manager functionality."""
 
 from unittest.mock import MagicMock
-from VLCYT.managers.playback_manager import PlaybackManager
-
-
-class TestPlaybackManager:
-    """Tests for PlaybackManager class."""
-
-    def test_playback_manager_initialization(self):
-        """Test PlaybackManager initialization."""
-        mock_vlc_player = MagicMock()
-        mock_thread_manager = MagicMock()
-
-        manager = PlaybackManager(mock_vlc_player, mock_thread_manager)
-
-        assert manager._vlc_player == mock_vlc_player
-        assert manager._thread_manager == mock_thread_manager
-        assert manager._current_video_info == {}
-        assert manager._is_playing is False
-        assert manager._is_paused is False
-
-    def test_play_stream(self):
-        """Test play stream functionality."""
-        mock_vlc_player = MagicMock()
-        mock_thread_manager = MagicMock()
-        manager = PlaybackManager(mock_vlc_player, mock_thread_manager)
-
-        # Mock the signal
-        manager.playback_started = MagicMock()
 
-        stream_url = "http://example.com/stream.m3u8"
-        video_info = {"title": "Test Video", "duration": 120}
+import pytest
 
-        manager.play_stream(stream_url, video_info)
+from VLCYT.managers.playback_manager import PlaybackManager
 
-        assert manager._current_video_info == video_info
-        assert manager._is_playing is True
-        assert manager._is_paused is False
-        mock_vlc_player.play.assert_called_once_with(stream_url)
-        manager.playback_started.emit.assert_called_once_with(video_info)
 
-    def test_stop_when_playing(self):
-        """Test stop when currently playing."""
-        mock_vlc_player = MagicMock()
-        mock_thread_manager = MagicMock()
-        manager = PlaybackManager(mock_vlc_player, mock_thread_manager)
+class FakeVLCPlayer:
+    """VLCPlayer double that records control calls and serves set values."""
 
-        # Mock the signal
-        manager.playback_stopped = MagicMock()
+    def __init__(self):
+        self.calls = []
+        self.time_changed_callback = None
+        self.time = 0
+        self.length = 0
+        self.position = 0.0
+        self.volume = 0
 
-        # Set up playing state
-        manager._is_playing = True
-        manager._is_paused = True
+    def set_time_changed_callback(self, callback):
+        self.time_changed_callback = callback
+        return True
 
-        manager.stop()
+    def play(self, url=None):
+        self.calls.append(("play", url))
 
-        assert manager._is_playing is False
-        assert manager._is_paused is False
-        mock_vlc_player.stop.assert_called_once()
-        manager.playback_stopped.emit.assert_called_once()
+    def pause(self):
+        self.calls.append(("pause",))
 
-    def test_stop_when_not_playing(self):
-        """Test stop when not currently playing."""
-        mock_vlc_player = MagicMock()
-        mock_thread_manager = MagicMock()
-        manager = PlaybackManager(mock_vlc_player, mock_thread_manager)
+    def stop(self):
+        self.calls.append(("stop",))
 
-        # Mock the signal
-        manager.playback_stopped = MagicMock()
+    def set_position(self, position):
+        self.calls.append(("set_position", position))
 
-        # Ensure not playing state
-        manager._is_playing = False
+    def set_time(self, ms):
+        self.calls.append(("set_time", ms))
 
-        manager.stop()
+    def set_volume(self, volume):
+        self.calls.append(("set_volume", volume))
 
-        # Should not call VLC stop or emit signal
-        mock_vlc_player.stop.assert_not_called()
-        manager.playback_stopped.emit.assert_not_called()
+    def get_time(self):
+        return self.time
 
-    def test_pause_when_playing(self):
-        """Test pause when currently playing."""
-        mock_vlc_player = MagicMock()
-        mock_thread_manager = MagicMock()
-        manager = PlaybackManager(mock_vlc_player, mock_thread_manager)
+    def get_length(self):
+        return self.length
 
-        # Mock the signal
-        manager.playback_paused = MagicMock()
+    def get_position(self):
+        return self.position
 
-        # Set up playing state
-        manager._is_playing = True
-        manager._is_paused = False
-
-        manager.pause()
+    def get_volume(self):
+        return self.volume
 
-        assert manager._is_paused is True
-        mock_vlc_player.pause.assert_called_once()
-        manager.playback_paused.emit.assert_called_once_with(True)
 
-    def test_pause_when_not_playing(self):
-        """Test pause when not currently playing."""
-        mock_vlc_player = MagicMock()
-        mock_thread_manager = MagicMock()
-        manager = PlaybackManager(mock_vlc_player, mock_thread_manager)
+@pytest.fixture
+def vlc_player():
+    """Fake VLCPlayer handed to the manager."""
+    return FakeVLCPlayer()
 
-        # Mock the signal
-        manager.playback_paused = MagicMock()
 
-        # Ensure not playing state
-        manager._is_playing = False
+def _signal_mock():
+    """Stand-in for a Qt signal; any attribute other than emit is an error."""
+    return MagicMock(spec_set=["emit"])
 
-        manager.pause()
 
-        # Should not call VLC pause or emit signal
-        mock_vlc_player.pause.assert_not_called()
-        manager.playback_paused.emit.assert_not_called()
+@pytest.fixture
+def mock_thread_manager():
+    """Mock ThreadManager handed to the manager."""
+    return MagicMock()
 
-    def test_resume_when_paused(self):
-        """Test resume when currently paused."""
-        mock_vlc_player = MagicMock()
-        mock_thread_manager = MagicMock()
-        manager = PlaybackManager(mock_vlc_player, mock_thread_manager)
 
-        # Mock the signal
-        manager.playback_paused = MagicMock()
-
-        # Set up paused state
-        manager._is_playing = True
-        manager._is_paused = True
+@pytest.fixture
+def manager(vlc_player, mock_thread_manager):
+    """PlaybackManager wired to the mock player and thread manager."""
+    return PlaybackManager(vlc_player, mock_thread_manager)
 
-        manager.resume()
 
-        assert manager._is_paused is False
-        mock_vlc_player.play.assert_called_once()
-        manager.playback_paused.emit.assert_called_once_with(False)
+class TestPlaybackManager:
+    """Tests for PlaybackManager class."""
 
-    def test_resume_when_not_paused(self):
-        """Test resume when not currently paused."""
-        mock_vlc_player = MagicMock()
-        mock_thread_manager = MagicMock()
-        manager = PlaybackManager(mock_vlc_player, mock_thread_manager)
+    def test_playback_manager_initialization(
+        self, manager, vlc_player, mock_thread_manager
+    ):
+        """Test PlaybackManager initialization."""
+        assert manager._vlc_player is vlc_player
+        assert manager._thread_manager == mock_thread_manager
+        assert (manager._is_playing, manager._is_paused) == (False, False)
+        assert manager._current_video_info == {}
 
+    def test_play_stream(self, manager, vlc_player, sample_video_info):
+        """Test play stream functionality."""
         # Mock the signal
-        manager.playback_paused = MagicMock()
-
-        # Ensure not paused state
-        manager._is_paused = False
+        manager.playback_started = _signal_mock()
 
-        manager.resume()
-
-        # Should not call VLC play or emit signal
-        mock_vlc_player.play.assert_not_called()
-        manager.playback_paused.emit.assert_not_called()
-
-    def test_seek_position(self):
+        stream_url = "http://example.com/stream.m3u8"
+        manager.play_stream(stream_url, sample_video_info)
+
+        assert (manager._is_playing, manager._is_paused) == (True, False)
+        assert manager._current_video_info == sample_video_info
+        assert vlc_player.calls == [("play", stream_url)]
+        manager.playback_started.emit.assert_called_once_with(sample_video_info)
+
+    @pytest.mark.parametrize(
+        "method,signal_name,playing,paused,calls,emitted,state",
+        [
+            pytest.param(
+                "stop",
+                "playback_stopped",
+                True,
+                True,
+                [("stop",)],
+                (),
+                (False, False),
+                id="stop_when_playing",
+            ),
+            pytest.param(
+                "stop",
+                "playback_stopped",
+                False,
+                False,
+                [],
+                None,
+                (False, False),
+                id="stop_when_not_playing",
+            ),
+            pytest.param(
+                "pause",
+                "playback_paused",
+                True,
+                False,
+                [("pause",)],
+                (True,),
+                (True, True),
+                id="pause_when_playing",
+            ),
+            pytest.param(
+                "pause",
+                "playback_paused",
+                False,
+                False,
+                [],
+                None,
+                (False, False),
+                id="pause_when_not_playing",
+            ),
+            pytest.param(
+                "resume",
+                "playback_paused",
+                True,
+                True,
+                [("play", None)],
+                (False,),
+                (True, False),
+                id="resume_when_paused",
+            ),
+            pytest.param(
+                "resume",
+                "playback_paused",
+                True,
+                False,
+                [],
+                None,
+                (True, False),
+                id="resume_when_not_paused",
+            ),
+        ],
+    )
+    def test_transport_control(
+        self,
+        manager,
+        vlc_player,
+        method,
+        signal_name,
+        playing,
+        paused,
+        calls,
+        emitted,
+        state,
+    ):
+        """Test stop/pause/resume reach VLC and signal only from a valid state."""
+        signal = _signal_mock()
+        setattr(manager, signal_name, signal)
+        manager._is_playing = playing
+        manager._is_paused = paused
+
+        getattr(manager, method)()
+
+        assert vlc_player.calls == calls
+        assert (manager._is_playing, manager._is_paused) == state
+        if emitted is None:
+            signal.emit.assert_not_called()
+        else:
+            signal.emit.assert_called_once_with(*emitted)
+
+    def test_seek_position(self, manager, vlc_player):
         """Test seek position functionality."""
-        mock_vlc_player = MagicMock()
-        mock_thread_manager = MagicMock()
-        manager = PlaybackManager(mock_vlc_player, mock_thread_manager)
-        manager.position_changed = MagicMock()
+        manager.position_changed = _signal_mock()
 
         # Set playing state first
         manager._is_playing = True
 
         manager.seek(0.75)
-        mock_vlc_player.set_position.assert_called_once_with(0.75)
+        assert vlc_player.calls == [("set_position", 0.75)]
 
-    def test_seek_time_functionality(self):
+    def test_seek_time_functionality(self, manager, vlc_player):
         """Test seek time functionality."""
-        mock_vlc_player = MagicMock()
-        mock_vlc_player.get_length.return_value = 120000  # 2 minutes
-        mock_thread_manager = MagicMock()
-        manager = PlaybackManager(mock_vlc_player, mock_thread_manager)
-        manager.position_changed = MagicMock()
+        vlc_player.length = 120000  # 2 minutes
+        manager.position_changed = _signal_mock()
 
         # Set playing state first
         manager._is_playing = True
@@ -181,16 +216,23 @@ class TestPlaybackManager:
 
         # Should calculate position and call set_position
         expected_position = 60 * 1000 / 120000  # 0.5
-        mock_vlc_player.set_position.assert_called_once_with(expected_position)
+        assert vlc_player.calls == [("set_position", expected_position)]
+
+    def test_set_time_functionality(self, manager, vlc_player):
+        """Test set time functionality."""
+        # Ignored while not playing
+        manager.set_time(45000)
+        assert vlc_player.calls == []
 
-    def test_seek_relative_functionality(self):
+        manager._is_playing = True
+        manager.set_time(45000)
+        assert vlc_player.calls == [("set_time", 45000)]
+
+    def test_seek_relative_functionality(self, manager, vlc_player):
         """Test seek relative functionality."""
-        mock_vlc_player = MagicMock()
-        mock_vlc_player.get_time.return_value = 30000  # 30 seconds in ms
-        mock_vlc_player.get_length.return_value = 120000  # 2 minutes in ms
-        mock_thread_manager = MagicMock()
-        manager = PlaybackManager(mock_vlc_player, mock_thread_manager)
-        manager.position_changed = MagicMock()
+        vlc_player.time = 30000  # 30 seconds in ms
+        vlc_player.length = 120000  # 2 minutes in ms
+        manager.position_changed = _signal_mock()
 
         # Set playing state first
         manager._is_playing = True
@@ -201,15 +243,11 @@ class TestPlaybackManager:
         # Should calculate new position and call set_position
         # new_time = 30 + 10 = 40 seconds, position = 40 * 1000 / 120000 = 0.333...
         expected_position = 40 * 1000 / 120000
-        mock_vlc_player.set_position.assert_called_once_with(expected_position)
+        assert vlc_player.calls == [("set_position", expected_position)]
 
-    def test_get_time_functionality(self):
+    def test_get_time_functionality(self, manager, vlc_player):
         """Test get time functionality."""
-        mock_vlc_player = MagicMock()
-        mock_thread_manager = MagicMock()
-        manager = PlaybackManager(mock_vlc_player, mock_thread_manager)
-
-        mock_vlc_player.get_time.return_value = 90000  # 90 seconds in ms
+        vlc_player.time = 90000  # 90 seconds in ms
 
         # Set playing state first
         manager._is_playing = True
@@ -219,13 +257,9 @@ class TestPlaybackManager:
         # Should return time in milliseconds as-is
         assert result == 90000
 
-    def test_get_length_functionality(self):
+    def test_get_length_functionality(self, manager, vlc_player):
         """Test get length functionality."""
-        mock_vlc_player = MagicMock()
-        mock_thread_manager = MagicMock()
-        manager = PlaybackManager(mock_vlc_player, mock_thread_manager)
-
-        mock_vlc_player.get_length.return_value = 180000  # 3 minutes in ms
+        vlc_player.length = 180000  # 3 minutes in ms
 
         # Set playing state first
         manager._is_playing = True
@@ -235,38 +269,26 @@ class TestPlaybackManager:
         # Should return length in milliseconds as-is
         assert result == 180000
 
-    def test_set_volume(self):
+    def test_set_volume(self, manager, vlc_player):
         """Test set volume functionality."""
-        mock_vlc_player = MagicMock()
-        mock_thread_manager = MagicMock()
-        manager = PlaybackManager(mock_vlc_player, mock_thread_manager)
-
         # Mock the signal
-        manager.volume_changed = MagicMock()
+        manager.volume_changed = _signal_mock()
 
         manager.set_volume(85)
 
-        mock_vlc_player.set_volume.assert_called_once_with(85)
+        assert vlc_player.calls == [("set_volume", 85)]
         manager.volume_changed.emit.assert_called_once_with(85)
 
-    def test_get_volume(self):
+    def test_get_volume(self, manager, vlc_player):
         """Test get volume functionality."""
-        mock_vlc_player = MagicMock()
-        mock_thread_manager = MagicMock()
-        manager = PlaybackManager(mock_vlc_player, mock_thread_manager)
-
-        mock_vlc_player.get_volume.return_value = 75
+        vlc_player.volume = 75
 
         result = manager.get_volume()
         assert result == 75
 
-    def test_get_position_functionality(self):
+    def test_get_position_functionality(self, manager, vlc_player):
         """Test get position functionality."""
-        mock_vlc_player = MagicMock()
-        mock_thread_manager = MagicMock()
-        manager = PlaybackManager(mock_vlc_player, mock_thread_manager)
-
-        mock_vlc_player.get_position.return_value = 0.6
+        vlc_player.position = 0.6
 
         # Set playing state first
         manager._is_playing = True
@@ -274,25 +296,15 @@ class TestPlaybackManager:
         result = manager.get_position()
         assert result == 0.6
 
-    def test_get_current_video_info_functionality(self):
+    def test_get_current_video_info_functionality(self, manager, sample_video_info):
         """Test get current video info functionality."""
-        mock_vlc_player = MagicMock()
-        mock_thread_manager = MagicMock()
-        manager = PlaybackManager(mock_vlc_player, mock_thread_manager)
-
-        # Set some video info
-        video_info = {"title": "Test Video", "duration": 300}
-        manager._current_video_info = video_info
+        manager._current_video_info = sample_video_info
 
         result = manager.get_current_video_info()
-        assert result == video_info
+        assert result == sample_video_info
 
-    def test_is_playing_functionality(self):
+    def test_is_playing_functionality(self, manager):
         """Test is playing functionality."""
-        mock_vlc_player = MagicMock()
-        mock_thread_manager = MagicMock()
-        manager = PlaybackManager(mock_vlc_player, mock_thread_manager)
-
         # Test initial state
         assert manager.is_playing() is False
 
@@ -300,15 +312,34 @@ class TestPlaybackManager:
         manager._is_playing = True
         assert manager.is_playing() is True
 
-    def test_is_paused_functionality(self):
+    def test_is_paused_functionality(self, manager):
         """Test is paused functionality."""
-        mock_vlc_player = MagicMock()
-        mock_thread_manager = MagicMock()
-        manager = PlaybackManager(mock_vlc_player, mock_thread_manager)
-
         # Test initial state
         assert manager.is_paused() is False
 
         # Test after setting to True
         manager._is_paused = True
         assert manager.is_paused() is True
+
+    def test_registers_time_changed_callback(self, manager, vlc_player):
+        """Test VLC time events are hooked up on initialization."""
+        assert vlc_player.time_changed_callback == manager._on_vlc_time_changed
+
+    def test_time_changed_emitted_only_while_playing(self, manager):
+        """Test VLC time events are relayed only during active playback."""
+        manager.time_changed = _signal_mock()
+
+        # Not playing - ignored
+        manager._on_vlc_time_changed(1000)
+        manager.time_changed.emit.assert_not_called()
+
+        # Paused - ignored
+        manager._is_playing = True
+        manager._is_paused = True
+        manager._on_vlc_time_changed(2000)
+        manager.time_changed.emit.assert_not_called()
+
+        # Playing - relayed
+        manager._is_paused = False
+        manager._on_vlc_time_changed(3000)
+        manager.time_changed.emit.assert_called_once_with(3000)
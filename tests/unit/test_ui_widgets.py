@@ -1,8 +1,21 @@
 """Tests for UI widgets."""
 
-from unittest.mock import patch
+import pytest
+
+from VLCYT.ui import widgets
 from VLCYT.ui.widgets import ModernButton
 
+pytestmark = pytest.mark.usefixtures("qapp")
+
+# The class body is built once at import, so flipping PYSIDE6_AVAILABLE
+# afterwards cannot switch a real Qt button to the fallback or back
+requires_qt = pytest.mark.skipif(
+    not widgets.PYSIDE6_AVAILABLE, reason="needs real PySide6 widgets"
+)
+requires_fallback = pytest.mark.skipif(
+    widgets.PYSIDE6_AVAILABLE, reason="fallback widgets only load without PySide6"
+)
+
 
 class TestModernButton:
     """Tests for ModernButton widget."""
@@ -17,11 +30,9 @@ class TestModernButton:
 
     def test_modern_button_with_parent(self):
         """Test ModernButton creation with parent."""
-        from unittest.mock import MagicMock
-
-        mock_parent = MagicMock()
+        parent = ModernButton("Parent")
 
-        button = ModernButton("Test", parent=mock_parent)
+        button = ModernButton("Test", parent=parent)
 
         assert button is not None
 
@@ -32,24 +43,27 @@ class TestModernButton:
         assert button is not None
         assert button.icon_text == "🎵"
 
-    @patch("VLCYT.ui.widgets.PYSIDE6_AVAILABLE", True)
+    @requires_qt
     def test_modern_button_hover_effects_available(self):
         """Test ModernButton hover effects when PySide6 available."""
+        from PySide6.QtCore import QEvent, QPointF
+        from PySide6.QtGui import QEnterEvent
+
         button = ModernButton("Hover Test")
 
         # Should have animation property
         assert hasattr(button, "_animation")
+        assert button.property("hover_progress") == 0.0
 
-        # Test enter event
-        from unittest.mock import MagicMock
+        # Entering starts the fade in; leaving mid-fade retargets it
+        point = QPointF(0, 0)
+        button.enterEvent(QEnterEvent(point, point, point))
+        assert button._animation.endValue() == 1.0
 
-        mock_event = MagicMock()
-        button.enterEvent(mock_event)  # Should not crash
-
-        # Test leave event
-        button.leaveEvent(mock_event)  # Should not crash
+        button.leaveEvent(QEvent(QEvent.Type.Leave))
+        assert button._animation.endValue() == 0.0
 
-    @patch("VLCYT.ui.widgets.PYSIDE6_AVAILABLE", False)
+    @requires_fallback
     def test_modern_button_fallback_mode(self):
         """Test ModernButton in fallback mode without PySide6."""
         button = ModernButton("Fallback Button")
@@ -77,6 +91,7 @@ class TestModernButtonFunctionality:
         button_with_icon = ModernButton("Text", icon_text="📀")
         assert button_with_icon is not None
 
+    @requires_fallback
     def test_modern_button_hover_progress_property(self):
         """Test hover progress property."""
         button = ModernButton("Test")
@@ -84,9 +99,9 @@ class TestModernButtonFunctionality:
         # Test default value
         assert button.hover_progress() == 0.0
 
-    @patch("VLCYT.ui.widgets.PYSIDE6_AVAILABLE", True)
-    def test_modern_button_property_animation(self):
+    def test_modern_button_property_animation(self, monkeypatch):
         """Test property animation setup."""
+        monkeypatch.setattr("VLCYT.ui.widgets.PYSIDE6_AVAILABLE", True)
         button = ModernButton("Animation Test")
 
         # Should have animation setup
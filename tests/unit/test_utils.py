@@ -1,14 +1,21 @@
 """Tests for VLCYT utilities."""
 
+import logging
+from unittest.mock import MagicMock, patch
+
+import pytest
+
 from VLCYT.utils.format_utils import format_time, format_file_size, sanitize_filename
+from VLCYT.utils.logging_config import initialize_logging
+from VLCYT.utils.transcript_fetcher import TranscriptFetcher
 
 
 class TestFormatUtils:
     """Tests for format utilities."""
 
-    def test_format_time(self):
-        """Test time formatting."""
-        test_cases = [
+    @pytest.mark.parametrize(
+        "seconds,expected",
+        [
             (0, "00:00"),
             (30, "00:30"),
             (60, "01:00"),
@@ -16,10 +23,11 @@ class TestFormatUtils:
             (3600, "01:00:00"),
             (3661, "01:01:01"),
             (7200, "02:00:00"),
-        ]
-
-        for seconds, expected in test_cases:
-            assert format_time(seconds) == expected
+        ],
+    )
+    def test_format_time(self, seconds, expected):
+        """Test time formatting."""
+        assert format_time(seconds) == expected
 
     def test_format_time_invalid(self):
         """Test time formatting with invalid input."""
@@ -27,29 +35,84 @@ class TestFormatUtils:
         result = format_time(-1)
         assert result == "00:00"
 
-    def test_format_file_size(self):
-        """Test file size formatting."""
-        test_cases = [
+    @pytest.mark.parametrize(
+        "bytes_size,expected",
+        [
             (0, "0 B"),
             (1024, "1.0 KB"),
             (1048576, "1.0 MB"),
             (1073741824, "1.00 GB"),  # GB uses 2 decimal places
             (1536, "1.5 KB"),
             (2621440, "2.5 MB"),
-        ]
-
-        for bytes_size, expected in test_cases:
-            assert format_file_size(bytes_size) == expected
+        ],
+    )
+    def test_format_file_size(self, bytes_size, expected):
+        """Test file size formatting."""
+        assert format_file_size(bytes_size) == expected
 
-    def test_sanitize_filename(self):
-        """Test filename sanitization."""
-        test_cases = [
+    @pytest.mark.parametrize(
+        "input_name,expected",
+        [
             ("normal_file.mp4", "normal_file.mp4"),
             ("file with spaces.mp4", "file with spaces.mp4"),
             ("file<>name.mp4", "file__name.mp4"),
             ("file|name.mp4", "file_name.mp4"),
             ("file:name.mp4", "file_name.mp4"),
+        ],
+    )
+    def test_sanitize_filename(self, input_name, expected):
+        """Test filename sanitization."""
+        assert sanitize_filename(input_name) == expected
+
+
+class TestLoggingConfig:
+    """Tests for logging setup."""
+
+    def test_reinitializing_flushes_buffered_records(self, tmp_path, monkeypatch):
+        """Test records buffered before a second setup reach the log file."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        root_logger = logging.getLogger()
+        saved_handlers = root_logger.handlers[:]
+        saved_level = root_logger.level
+        try:
+            initialize_logging("VLCYTTest")
+            logging.getLogger("test").info("logged before second setup")
+            initialize_logging("VLCYTTest")
+        finally:
+            for handler in root_logger.handlers[:]:
+                root_logger.removeHandler(handler)
+                handler.close()
+            for handler in saved_handlers:
+                root_logger.addHandler(handler)
+            root_logger.setLevel(saved_level)
+
+        log_text = "".join(
+            path.read_text() for path in (tmp_path / ".vlcyttest" / "logs").iterdir()
+        )
+        assert "logged before second setup" in log_text
+
+
+class TestTranscriptFetcher:
+    """Tests for transcript fetcher."""
+
+    def test_fetch_transcript_cached_by_video_id(self):
+        """Test a video's transcript is downloaded only once."""
+        fetcher = TranscriptFetcher()
+        fetcher.available = True
+        api = MagicMock()
+        transcript = api.list_transcripts.return_value.find_manually_created_transcript
+        transcript.return_value.fetch.return_value = [
+            {"start": 1.0, "duration": 2.0, "text": " hello "}
         ]
 
-        for input_name, expected in test_cases:
-            assert sanitize_filename(input_name) == expected
+        with patch(
+            "VLCYT.utils.transcript_fetcher.YouTubeTranscriptApi", api, create=True
+        ):
+            first = fetcher.fetch_transcript("https://youtu.be/abc123")
+            second = fetcher.fetch_transcript(
+                "https://www.youtube.com/watch?v=abc123"
+            )
+
+        assert first == [{"start": 1.0, "duration": 2.0, "text": "hello"}]
+        assert second is first
+        api.list_transcripts.assert_called_once_with("abc123")
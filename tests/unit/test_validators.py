@@ -1,6 +1,9 @@
 """Tests for VLCYT validators."""
 
+import time
+
 import pytest
+
 from VLCYT.validators import URLValidator, NetworkValidator, InputValidator
 from VLCYT.exceptions import ValidationError, SecurityError
 
@@ -8,35 +11,104 @@ from VLCYT.exceptions import ValidationError, SecurityError
 class TestURLValidator:
     """Tests for URL validation."""
 
-    def test_valid_youtube_urls(self):
-        """Test validation of valid YouTube URLs."""
-        valid_urls = [
+    @pytest.mark.parametrize(
+        "url",
+        [
             "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
             "https://youtube.com/watch?v=dQw4w9WgXcQ",
             "https://youtu.be/dQw4w9WgXcQ",
             "https://m.youtube.com/watch?v=dQw4w9WgXcQ",
-        ]
-
+        ],
+    )
+    def test_valid_youtube_urls(self, url):
+        """Test validation of valid YouTube URLs."""
         # All URLs should be normalized to the same format
-        expected_normalized = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
-
-        for url in valid_urls:
-            validated = URLValidator.validate_youtube_url(url)
-            assert validated == expected_normalized
+        validated = URLValidator.validate_youtube_url(url)
+        assert validated == "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
 
-    def test_invalid_youtube_urls(self):
-        """Test validation of invalid YouTube URLs."""
-        invalid_urls = [
+    @pytest.mark.parametrize(
+        "url",
+        [
             "https://vimeo.com/123456",
             "https://example.com/watch?v=test",
             "not_a_url",
             "ftp://youtube.com/watch?v=test",
             "javascript:alert('xss')",
-        ]
+        ],
+    )
+    def test_invalid_youtube_urls(self, url):
+        """Test validation of invalid YouTube URLs."""
+        with pytest.raises((ValidationError, SecurityError)):
+            URLValidator.validate_youtube_url(url)
 
-        for url in invalid_urls:
-            with pytest.raises((ValidationError, SecurityError)):
-                URLValidator.validate_youtube_url(url)
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "javascript:alert('xss')",
+            "<script>alert(1)</script>",
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ<script>",
+        ],
+    )
+    def test_injection_attempts_raise_security_error(self, url):
+        """Test markup injection is reported as a security issue."""
+        with pytest.raises(SecurityError):
+            URLValidator.validate_youtube_url(url)
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            pytest.param(
+                "https://www.youtube.com/watch?v=" + "a_" * 80, id="underscore_run"
+            ),
+            pytest.param("https://m.youtube.com/watch?v=" + "0." * 900, id="dotted"),
+            pytest.param("https://youtu.be/" + "x" * 500 + "-" * 500, id="dash_run"),
+            pytest.param("https://youtu.be/" + "-" * 2000, id="long_short_link"),
+            pytest.param(
+                "https://www.youtube.com/watch?v=" + "a" * 10 + "&" * 2000,
+                id="long_query",
+            ),
+            pytest.param(
+                "https://www.youtube.com/embed/" + "a" * 11 + "/" * 2000,
+                id="long_path",
+            ),
+        ],
+    )
+    def test_pathological_urls_fail_fast(self, url, monkeypatch):
+        """Test near-miss URLs reach the pattern and fail without backtracking."""
+        from unittest.mock import MagicMock
+
+        pattern = MagicMock(wraps=URLValidator.YOUTUBE_URL_RE)
+        monkeypatch.setattr(URLValidator, "YOUTUBE_URL_RE", pattern)
+
+        start = time.perf_counter()
+        with pytest.raises(ValidationError):
+            URLValidator.validate_youtube_url(url)
+        assert time.perf_counter() - start < 1.0
+        assert pattern.match.call_count == 1
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            pytest.param(
+                "https://www.youtube.com/watch?v=" + "a" * 11 + "&" + "x\n" * 25000,
+                id="watch_tail_newlines",
+            ),
+            pytest.param(
+                "https://youtu.be/" + "a" * 11 + "?" + "x\n" * 25000,
+                id="short_link_tail_newlines",
+            ),
+            pytest.param("https://youtu.be/" + "a_" * 25000, id="underscore_run"),
+            pytest.param("https://" + "x" * 25000 + "-" * 25000, id="host_dash_run"),
+            pytest.param(
+                "https://www.youtube.com/embed/" + "-" * 50000, id="long_embed_id"
+            ),
+        ],
+    )
+    def test_url_pattern_is_linear_on_long_near_misses(self, url):
+        """Test the URL pattern rejects 50k-character near misses quickly."""
+        start = time.perf_counter()
+        assert URLValidator.YOUTUBE_URL_RE.match(url) is None
+        assert time.perf_counter() - start < 1.0
 
     def test_empty_url(self):
         """Test validation of empty URL."""
@@ -46,75 +118,91 @@ class TestURLValidator:
         with pytest.raises(ValidationError):
             URLValidator.validate_youtube_url(None)
 
+    def test_repeated_validation_is_cached(self):
+        """Test repeated validation of the same URL hits the cache."""
+        url = "https://youtu.be/aBcDeFgHiJk"
+        URLValidator.validate_youtube_url(url)
+        hits_before = URLValidator._validate_youtube_url_cached.cache_info().hits
+
+        validated = URLValidator.validate_youtube_url(url)
+
+        assert validated == "https://www.youtube.com/watch?v=aBcDeFgHiJk"
+        cache_info = URLValidator._validate_youtube_url_cached.cache_info()
+        assert cache_info.hits == hits_before + 1
+
+    def test_percent_encoded_query_is_checked(self):
+        """Test suspicious characters hidden by percent-encoding are caught."""
+        with pytest.raises(SecurityError):
+            URLValidator.validate_youtube_url(
+                "https://youtu.be/dQw4w9WgXcQ?x=%3Cscript%3E"
+            )
+
+    def test_playlist_duplicate_reports_line(self):
+        """Test a duplicate playlist URL is reported with its line number."""
+        text = (
+            "https://youtu.be/dQw4w9WgXcQ\n"
+            "https://youtu.be/aBcDeFgHiJk\n"
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ\n"
+        )
+
+        with pytest.raises(ValidationError, match="line 3"):
+            URLValidator.validate_playlist_urls(text)
+
 
 class TestNetworkValidator:
     """Tests for network validation."""
 
-    def test_valid_ports(self):
+    @pytest.mark.parametrize("port", [1024, 8081, 65535, "8081", "1024"])
+    def test_valid_ports(self, port):
         """Test validation of valid port numbers."""
-        valid_ports = [1024, 8081, 65535, "8081", "1024"]
+        validated = NetworkValidator.validate_port(port)
+        assert isinstance(validated, int)
+        assert validated == int(port)
 
-        for port in valid_ports:
-            validated = NetworkValidator.validate_port(port)
-            assert isinstance(validated, int)
-            assert 1024 <= validated <= 65535
-
-    def test_invalid_ports(self):
+    @pytest.mark.parametrize("port", [0, 1023, 65536, -1, "invalid", None])
+    def test_invalid_ports(self, port):
         """Test validation of invalid port numbers."""
-        invalid_ports = [0, 1023, 65536, -1, "invalid", None]
-
-        for port in invalid_ports:
-            with pytest.raises(ValidationError):
-                NetworkValidator.validate_port(port)
+        with pytest.raises(ValidationError):
+            NetworkValidator.validate_port(port)
 
-    def test_valid_ip_addresses(self):
+    # Use only truly non-reserved private IPs
+    @pytest.mark.parametrize("ip", ["192.168.1.100", "10.0.0.100"])
+    def test_valid_ip_addresses(self, ip):
         """Test validation of valid IP addresses."""
-        # Use only truly non-reserved private IPs
-        valid_ips = ["192.168.1.100", "10.0.0.100"]
-
-        for ip in valid_ips:
-            validated = NetworkValidator.validate_ip_address(ip)
-            assert validated == ip
+        assert NetworkValidator.validate_ip_address(ip) == ip
 
-    def test_invalid_ip_addresses(self):
+    @pytest.mark.parametrize("ip", ["256.1.1.1", "192.168.1", "not_an_ip", ""])
+    def test_invalid_ip_addresses(self, ip):
         """Test validation of invalid IP addresses."""
-        invalid_ips = ["256.1.1.1", "192.168.1", "not_an_ip", ""]
-
-        for ip in invalid_ips:
-            with pytest.raises(ValidationError):
-                NetworkValidator.validate_ip_address(ip)
+        with pytest.raises(ValidationError):
+            NetworkValidator.validate_ip_address(ip)
 
 
 class TestInputValidator:
     """Tests for input validation."""
 
-    def test_safe_filenames(self):
+    @pytest.mark.parametrize("name", ["video.mp4", "my_video.mp4", "test-video.mp4"])
+    def test_safe_filenames(self, name):
         """Test validation of safe filenames."""
-        safe_names = ["video.mp4", "my_video.mp4", "test-video.mp4"]
-
-        for name in safe_names:
-            validated = InputValidator.validate_filename(name)
-            assert validated == name
+        assert InputValidator.validate_filename(name) == name
 
-    def test_unsafe_filenames(self):
+    @pytest.mark.parametrize(
+        "name", ["con.txt", "aux.mp4", "video<>.mp4", "video|name.mp4"]
+    )
+    def test_unsafe_filenames(self, name):
         """Test validation of unsafe filenames."""
-        unsafe_names = ["con.txt", "aux.mp4", "video<>.mp4", "video|name.mp4"]
-
-        for name in unsafe_names:
-            with pytest.raises(ValidationError):
-                InputValidator.validate_filename(name)
+        with pytest.raises(ValidationError):
+            InputValidator.validate_filename(name)
 
-    def test_search_query_validation(self):
+    @pytest.mark.parametrize("query", ["hello world", "test query", "video title"])
+    def test_search_query_validation(self, query):
         """Test search query validation."""
-        valid_queries = ["hello world", "test query", "video title"]
-
-        for query in valid_queries:
-            validated = InputValidator.validate_search_query(query)
-            assert validated == query
-
-        # Test malicious queries
-        malicious_queries = ["<script>alert('xss')</script>", "javascript:alert('xss')"]
-
-        for query in malicious_queries:
-            with pytest.raises(SecurityError):
-                InputValidator.validate_search_query(query)
+        assert InputValidator.validate_search_query(query) == query
+
+    @pytest.mark.parametrize(
+        "query", ["<script>alert('xss')</script>", "javascript:alert('xss')"]
+    )
+    def test_malicious_search_query(self, query):
+        """Test search queries carrying script are rejected."""
+        with pytest.raises(SecurityError):
+            InputValidator.validate_search_query(query)
@@ -1,136 +1,135 @@
 """Tests for VLC Player core functionality."""
 
-from unittest.mock import patch
+import pytest
+
 from VLCYT.core.vlc_player import VLCPlayer
 
 
+@pytest.fixture
+def player():
+    """Freshly initialized player."""
+    return VLCPlayer()
+
+
+@pytest.fixture(scope="module")
+def nulled_player():
+    """Initialized player with no media player; every call is a no-op on it."""
+    player = VLCPlayer()
+    player._media_player = None
+    return player
+
+
 class TestVLCPlayerBasic:
     """Tests for VLCPlayer basic functionality."""
 
-    def test_vlc_player_initialization(self):
+    def test_vlc_player_initialization(self, player):
         """Test VLC player initialization."""
-        player = VLCPlayer()
-
         # Basic attributes should be initialized
-        assert hasattr(player, "_instance")
-        assert hasattr(player, "_media_player")
-        assert hasattr(player, "_media")
-        assert hasattr(player, "_embed_handle")
-        assert hasattr(player, "_streaming_disabled")
+        expected = {
+            "_instance",
+            "_media_player",
+            "_media",
+            "_embed_handle",
+            "_streaming_disabled",
+        }
+        assert expected - vars(player).keys() == set()
 
     def test_vlc_player_initial_state(self):
         """Test VLC player initial state."""
         player = VLCPlayer()
 
-        # Check initial values
+        # Check initial values; libVLC is mocked, so initialization succeeds
         assert player._media is None
         assert player._embed_handle is None
-        assert player._streaming_disabled is True
+        assert player._streaming_disabled is False
 
-    @patch("VLCYT.core.vlc_player.VLC_AVAILABLE", False)
-    def test_vlc_not_available(self):
+    def test_vlc_not_available(self, monkeypatch):
         """Test behavior when VLC is not available."""
+        monkeypatch.setattr("VLCYT.core.vlc_player.VLC_AVAILABLE", False)
         player = VLCPlayer()
 
         # Should handle gracefully when VLC not available
         assert player._instance is None
         assert player._media_player is None
 
-    def test_setup_embedding_no_media_player(self):
-        """Test embedding setup when media player is None."""
-        player = VLCPlayer()
-        player._media_player = None
-
-        result = player.setup_embedding(12345)
-        assert result is False
-
-    def test_get_volume_no_media_player(self):
-        """Test getting volume when no media player."""
-        player = VLCPlayer()
-        player._media_player = None
-
-        result = player.get_volume()
-        assert result == 0  # Default when no media player
-
-    def test_get_time_no_media_player(self):
-        """Test getting time when no media player."""
-        player = VLCPlayer()
-        player._media_player = None
-
-        result = player.get_time()
-        assert result == 0
-
-    def test_get_length_no_media_player(self):
-        """Test getting length when no media player."""
-        player = VLCPlayer()
-        player._media_player = None
-
-        result = player.get_length()
-        assert result == 0
-
-    def test_get_position_no_media_player(self):
-        """Test getting position when no media player."""
-        player = VLCPlayer()
-        player._media_player = None
-
-        result = player.get_position()
-        assert result == 0.0
-
-    def test_is_playing_no_media_player(self):
-        """Test is_playing when no media player."""
-        player = VLCPlayer()
-        player._media_player = None
-
-        result = player.is_playing()
-        assert result is False
-
-    def test_play_no_media_player(self):
-        """Test play when no media player."""
-        player = VLCPlayer()
-        player._media_player = None
-
-        result = player.play("http://test.url")
-        assert result is False
-
-    def test_pause_no_media_player(self):
-        """Test pause when no media player."""
-        player = VLCPlayer()
-        player._media_player = None
+    @pytest.mark.parametrize(
+        "call,expected",
+        [
+            pytest.param(
+                lambda p: p.setup_embedding(12345), False, id="setup_embedding"
+            ),
+            pytest.param(lambda p: p.get_volume(), 0, id="get_volume"),
+            pytest.param(lambda p: p.get_time(), 0, id="get_time"),
+            pytest.param(lambda p: p.get_length(), 0, id="get_length"),
+            pytest.param(lambda p: p.get_position(), 0.0, id="get_position"),
+            pytest.param(lambda p: p.is_playing(), False, id="is_playing"),
+            pytest.param(lambda p: p.play("http://test.url"), False, id="play"),
+            pytest.param(lambda p: p.pause(), False, id="pause"),
+            pytest.param(lambda p: p.stop(), False, id="stop"),
+            pytest.param(lambda p: p.set_volume(50), False, id="set_volume"),
+            pytest.param(lambda p: p.set_time(30000), False, id="set_time"),
+            pytest.param(lambda p: p.set_position(0.5), False, id="set_position"),
+            pytest.param(
+                lambda p: p.set_time_changed_callback(lambda ms: None),
+                False,
+                id="set_time_changed_callback",
+            ),
+        ],
+    )
+    def test_no_media_player(self, nulled_player, call, expected):
+        """Test each operation returns its neutral value without a media player."""
+        result = call(nulled_player)
+        assert result == expected
+        assert type(result) is type(expected)
+
+    def test_time_changed_event_forwarded(self):
+        """Test VLC time events are forwarded to the registered callback."""
+        from unittest.mock import MagicMock
+
+        player = VLCPlayer()
+        received = []
+        player._time_changed_callback = received.append
+
+        event = MagicMock()
+        event.u.new_time = 42000
+        player._on_time_changed_event(event)
+
+        assert received == [42000]
+
+    def test_deferred_initialization(self):
+        """Test VLC setup is postponed until initialize() when deferred."""
+        player = VLCPlayer(defer_init=True)
+        assert player.is_initialized() is False
+        assert player._instance is None
 
-        result = player.pause()
-        assert result is False
+        player.initialize()
+        assert player.is_initialized() is True
 
-    def test_stop_no_media_player(self):
-        """Test stop when no media player."""
-        player = VLCPlayer()
-        player._media_player = None
-
-        result = player.stop()
-        assert result is False
+    def test_not_initialized_until_media_player_exists(self, monkeypatch):
+        """Test is_initialized() stays False while libVLC is still starting."""
+        from unittest.mock import MagicMock
 
-    def test_set_volume_no_media_player(self):
-        """Test setting volume when no media player."""
-        player = VLCPlayer()
-        player._media_player = None
+        monkeypatch.setattr("VLCYT.core.vlc_player.VLC_AVAILABLE", True)
+        player = VLCPlayer(defer_init=True)
+        seen = []
 
-        result = player.set_volume(50)
-        assert result is False
+        def fake_instance(args):
+            seen.append(player.is_initialized())
+            return MagicMock()
 
-    def test_set_time_no_media_player(self):
-        """Test setting time when no media player."""
-        player = VLCPlayer()
-        player._media_player = None
+        monkeypatch.setattr("VLCYT.core.vlc_player.vlc.Instance", fake_instance)
+        player.initialize()
 
-        result = player.set_time(30000)
-        assert result is False
+        assert seen == [False]
+        assert player.is_initialized() is True
 
-    def test_set_position_no_media_player(self):
-        """Test setting position when no media player."""
-        player = VLCPlayer()
-        player._media_player = None
+    def test_time_changed_callback_kept_until_initialized(self):
+        """Test a callback registered before initialize() is retained."""
+        player = VLCPlayer(defer_init=True)
+        callback = lambda ms: None  # noqa: E731
 
-        result = player.set_position(0.5)
-        assert result is False
+        assert player.set_time_changed_callback(callback) is True
+        assert player._time_changed_callback is callback
 
     def test_streaming_operations_no_media_player(self):
         """Test streaming operations when no media player."""
@@ -150,24 +149,27 @@ class TestVLCPlayerBasic:
 class TestVLCPlayerAttributes:
     """Tests for VLCPlayer attribute access."""
 
-    def test_media_attribute_initialization(self):
-        """Test media attribute initialization."""
-        player = VLCPlayer()
-        assert player._media is None
-
-    def test_embed_handle_initialization(self):
-        """Test embed handle initialization."""
-        player = VLCPlayer()
-        assert player._embed_handle is None
-
-    def test_streaming_disabled_initialization(self):
-        """Test streaming disabled initialization."""
-        player = VLCPlayer()
-        assert player._streaming_disabled is True
-
-    def test_cleanup_method_exists(self):
+    @pytest.mark.parametrize(
+        "attr,expected",
+        [
+            ("_media", None),
+            ("_embed_handle", None),
+            ("_streaming_disabled", False),
+            ("_streaming_disabled_on_init", False),
+        ],
+    )
+    def test_initial_attribute(self, player, attr, expected):
+        """Test each attribute's value after VLC initializes."""
+        assert getattr(player, attr) is expected
+
+    def test_streaming_disabled_on_init_without_vlc(self, monkeypatch):
+        """Test failed VLC initialization is reported."""
+        monkeypatch.setattr("VLCYT.core.vlc_player.VLC_AVAILABLE", False)
+        player = VLCPlayer()
+        assert player.streaming_disabled_on_init() is True
+
+    def test_cleanup_method_exists(self, player):
         """Test cleanup method exists."""
-        player = VLCPlayer()
         assert hasattr(player, "cleanup")
 
         # Should not raise exception